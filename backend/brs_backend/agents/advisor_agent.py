@@ -6,8 +6,10 @@ from langchain_core.messages import HumanMessage
 from langgraph.prebuilt import create_react_agent
 
 from brs_backend.core.config import get_openai_model
+from brs_backend.database.connection import tool_session
 from brs_backend.agents.advisor_tools import (
     get_pending_requests,
+    count_pending_requests,
     explain_rule,
     propose_alternatives,
     decide_request,
@@ -23,6 +25,7 @@ def create_advisor_agent():
     
     tools = [
         get_pending_requests,
+        count_pending_requests,
         explain_rule,
         propose_alternatives,
         decide_request,
@@ -53,6 +56,8 @@ When reviewing requests:
 - Review student academic standing
 - Assess impact on degree progress
 
+Use count_pending_requests when you only need to know how many requests are waiting.
+
 Always provide detailed reasoning for your decisions and suggest next steps."""
 
     agent = create_react_agent(model, tools, state_modifier=system_prompt)
@@ -80,9 +85,10 @@ def process_advisor_request(advisor_id: str, request: str, context: dict[str, An
     
     # Process the request
     try:
-        result = agent.invoke({
-            "messages": [HumanMessage(content=message_content)]
-        })
+        with tool_session():
+            result = agent.invoke({
+                "messages": [HumanMessage(content=message_content)]
+            })
         
         # Extract the response
         messages = result.get("messages", [])
@@ -133,9 +139,10 @@ def handle_request_review(advisor_id: str, request_id: str, action: str, reasoni
     """
     
     try:
-        result = agent.invoke({
-            "messages": [HumanMessage(content=message)]
-        })
+        with tool_session():
+            result = agent.invoke({
+                "messages": [HumanMessage(content=message)]
+            })
         
         messages = result.get("messages", [])
         if messages:
@@ -188,9 +195,10 @@ def get_student_advisory_summary(advisor_id: str, student_id: str) -> dict[str,
     """
     
     try:
-        result = agent.invoke({
-            "messages": [HumanMessage(content=message)]
-        })
+        with tool_session():
+            result = agent.invoke({
+                "messages": [HumanMessage(content=message)]
+            })
         
         messages = result.get("messages", [])
         if messages:
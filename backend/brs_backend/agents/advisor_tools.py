@@ -1,22 +1,87 @@
 """Advisor business logic tools for reviewing requests and managing approvals."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
-
-from brs_backend.database.connection import SessionLocal
+from sqlalchemy import bindparam, func, select
+from sqlalchemy.orm import contains_eager, raiseload, selectinload
+
+from brs_backend.database.connection import (
+    ReadOnlySessionLocal,
+    SessionLocal,
+    release_session,
+    ro_conn,
+    shared_session,
+)
 from brs_backend.models.database import (
     Course,
     Enrollment,
+    Instructor,
     RegistrationRequest,
     Section,
     Student,
 )
 
 
+# Profile queries are built once so SQLAlchemy's compiled cache serves every call
+_PROFILE_STUDENT_STMT = select(
+    Student.student_id,
+    Student.external_sis_id,
+    Student.gpa,
+    Student.credits_completed,
+    Student.standing,
+    Student.student_status,
+).where(Student.student_id == bindparam("student_id"))
+
+_PROFILE_ENROLLMENTS_STMT = (
+    select(
+        Course.code,
+        Course.title,
+        Section.section_code,
+        Course.credits,
+        Instructor.name.label("instructor"),
+    )
+    .select_from(Enrollment)
+    .join(Section, Enrollment.section_id == Section.section_id)
+    .join(Course, Section.course_id == Course.course_id)
+    .outerjoin(Instructor, Section.instructor_id == Instructor.instructor_id)
+    .where(
+        Enrollment.student_id == bindparam("student_id"),
+        Enrollment.status == "registered",
+    )
+)
+
+_PROFILE_REQUESTS_STMT = (
+    select(
+        RegistrationRequest.request_id,
+        RegistrationRequest.type,
+        RegistrationRequest.state,
+        RegistrationRequest.created_at,
+        RegistrationRequest.reason,
+    )
+    .where(RegistrationRequest.student_id == bindparam("student_id"))
+    .order_by(RegistrationRequest.created_at.desc())
+    .limit(10)
+)
+
+# Existence probe: selects the key only, no Student instance is built
+_STUDENT_KEY_STMT = select(Student.student_id).where(
+    Student.student_id == bindparam("student_id")
+)
+
+# Request states that make up the advisor review queue
+_PENDING_STATES = ("submitted", "pending_approval")
+
+_PENDING_COUNT_STMT = (
+    select(func.count())
+    .select_from(RegistrationRequest)
+    .where(RegistrationRequest.state.in_(_PENDING_STATES))
+)
+
+
 class PendingRequestsResult(BaseModel):
     """Result structure for pending requests query."""
     success: bool = Field(description="Whether the operation was successful")
@@ -64,6 +129,13 @@ class StudentProfileResult(BaseModel):
     error: str | None = Field(description="Error message if operation failed")
 
 
+class PendingCountResult(BaseModel):
+    """Result structure for the pending request count."""
+    success: bool = Field(description="Whether the count was retrieved")
+    total_count: int = Field(description="Number of requests awaiting review")
+    error: str | None = Field(description="Error message if operation failed")
+
+
 class AdviseesResult(BaseModel):
     """Result structure for advisees list."""
     success: bool = Field(description="Whether the advisees list was retrieved")
@@ -81,14 +153,25 @@ def get_pending_requests(advisor_id: str, program_code: str | None = None) -> Pe
         advisor_id: UUID string of the advisor
         program_code: Optional program code to filter by
     """
+    db = ReadOnlySessionLocal()
     try:
-        db = SessionLocal()
-
         # Get pending requests (simplified - would include proper advisor scoping)
+        # Students come from the join and sections/courses are batch-loaded;
+        # any other relationship access raises instead of querying per request
         query = (
             db.query(RegistrationRequest)
             .join(Student, RegistrationRequest.student_id == Student.student_id)
-            .filter(RegistrationRequest.state.in_(["submitted", "pending_approval"]))
+            .options(
+                contains_eager(RegistrationRequest.student),
+                selectinload(RegistrationRequest.to_section).selectinload(
+                    Section.course
+                ),
+                selectinload(RegistrationRequest.from_section).selectinload(
+                    Section.course
+                ),
+                raiseload("*"),
+            )
+            .filter(RegistrationRequest.state.in_(_PENDING_STATES))
         )
 
         if program_code:
@@ -97,59 +180,19 @@ def get_pending_requests(advisor_id: str, program_code: str | None = None) -> Pe
 
         requests = query.all()
 
-        request_list = []
-        for request in requests:
-            student = request.student
-            to_section = None
-            from_section = None
-
-            if request.to_section_id:
-                to_section = (
-                    db.query(Section)
-                    .filter(Section.section_id == request.to_section_id)
-                    .first()
-                )
-
-            if request.from_section_id:
-                from_section = (
-                    db.query(Section)
-                    .filter(Section.section_id == request.from_section_id)
-                    .first()
-                )
-
-            request_data = {
+        request_list = [
+            {
                 "request_id": str(request.request_id),
                 "type": request.type,
                 "state": request.state,
                 "reason": request.reason,
                 "created_at": request.created_at.isoformat(),
-                "student": {
-                    "student_id": str(student.student_id),
-                    "external_sis_id": student.external_sis_id,
-                    "gpa": float(student.gpa) if student.gpa else None,
-                    "standing": student.standing,
-                },
-                "to_section": {
-                    "section_id": str(to_section.section_id),
-                    "course_code": to_section.course.code,
-                    "course_title": to_section.course.title,
-                    "section_code": to_section.section_code,
-                }
-                if to_section
-                else None,
-                "from_section": {
-                    "section_id": str(from_section.section_id),
-                    "course_code": from_section.course.code,
-                    "course_title": from_section.course.title,
-                    "section_code": from_section.section_code,
-                }
-                if from_section
-                else None,
+                "student": _student_summary(request.student),
+                "to_section": _section_summary(request.to_section),
+                "from_section": _section_summary(request.from_section),
             }
-
-            request_list.append(request_data)
-
-        db.close()
+            for request in requests
+        ]
 
         return PendingRequestsResult(
             success=True,
@@ -165,6 +208,33 @@ def get_pending_requests(advisor_id: str, program_code: str | None = None) -> Pe
             total_count=0,
             error=f"Error getting pending requests: {str(e)}"
         )
+    finally:
+        db.close()
+
+
+@tool
+def count_pending_requests(advisor_id: str) -> PendingCountResult:
+    """QUICK CHECK: count registration requests awaiting advisor review.
+
+    Use this instead of get_pending_requests when only the number is needed.
+
+    Args:
+        advisor_id: UUID string of the advisor
+    """
+    db = ro_conn()
+    try:
+        total_count = db.execute(_PENDING_COUNT_STMT).scalar_one()
+
+        return PendingCountResult(success=True, total_count=total_count, error=None)
+
+    except Exception as e:
+        return PendingCountResult(
+            success=False,
+            total_count=0,
+            error=f"Error counting pending requests: {str(e)}"
+        )
+    finally:
+        db.close()
 
 
 @tool
@@ -241,13 +311,11 @@ def propose_alternatives(student_id: str, original_request: dict) -> Alternative
         student_id: UUID string of the student
         original_request: Original request data that has violations
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
         # Get student info
-        student = db.query(Student).filter(Student.student_id == student_id).first()
-        if not student:
-            db.close()
+        student_key = db.scalar(_STUDENT_KEY_STMT, {"student_id": student_id})
+        if student_key is None:
             return AlternativesResult(
                 success=False,
                 student_id=student_id,
@@ -288,8 +356,6 @@ def propose_alternatives(student_id: str, original_request: dict) -> Alternative
 
         reasoning = "Option 1 provides the best fit with minimal schedule disruption. Option 2 offers similar learning outcomes but different focus area."
 
-        db.close()
-
         return AlternativesResult(
             success=True,
             student_id=student_id,
@@ -308,6 +374,8 @@ def propose_alternatives(student_id: str, original_request: dict) -> Alternative
             reasoning="",
             error=f"Error proposing alternatives: {str(e)}"
         )
+    finally:
+        release_session(db)
 
 
 @tool
@@ -322,17 +390,11 @@ def decide_request(
         rationale: Explanation for the decision
         advisor_id: UUID string of the advisor making the decision
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
-        request = (
-            db.query(RegistrationRequest)
-            .filter(RegistrationRequest.request_id == UUID(request_id))
-            .first()
-        )
+        request = db.get(RegistrationRequest, UUID(request_id))
 
         if not request:
-            db.close()
             return RequestDecisionResult(
                 success=False,
                 request_id=request_id,
@@ -352,7 +414,6 @@ def decide_request(
 
         new_state = state_mapping.get(action)
         if not new_state:
-            db.close()
             return RequestDecisionResult(
                 success=False,
                 request_id=request_id,
@@ -364,10 +425,9 @@ def decide_request(
 
         request.state = new_state
         request.advisor_notes = rationale
-        request.reviewed_at = datetime.utcnow()
+        request.reviewed_at = datetime.now(timezone.utc)
 
         db.commit()
-        db.close()
 
         # Determine next steps based on action
         next_steps_mapping = {
@@ -395,6 +455,8 @@ def decide_request(
             next_steps="",
             error=f"Error deciding request: {str(e)}"
         )
+    finally:
+        release_session(db)
 
 
 @tool
@@ -405,14 +467,15 @@ def get_student_profile(student_id: str, advisor_id: str) -> StudentProfileResul
         student_id: UUID string of the student
         advisor_id: UUID string of the advisor (for authorization)
     """
+    db = ro_conn()
     try:
-        db = SessionLocal()
+        student_uuid = UUID(student_id)
 
-        student = (
-            db.query(Student).filter(Student.student_id == UUID(student_id)).first()
-        )
+        # Only the profile columns are read, so skip hydrating a Student entity
+        student = db.execute(
+            _PROFILE_STUDENT_STMT, {"student_id": student_uuid}
+        ).first()
         if not student:
-            db.close()
             return StudentProfileResult(
                 success=False,
                 student_info={},
@@ -432,38 +495,28 @@ def get_student_profile(student_id: str, advisor_id: str) -> StudentProfileResul
             "status": student.student_status,
         }
 
-        # Get current enrollments
-        enrollments = (
-            db.query(Enrollment)
-            .join(Section, Enrollment.section_id == Section.section_id)
-            .join(Course, Section.course_id == Course.course_id)
-            .filter(
-                Enrollment.student_id == UUID(student_id),
-                Enrollment.status == "registered",
-            )
-            .all()
-        )
+        # Get current enrollments as flat rows; the columns come straight from
+        # the joins instead of lazy-loading each enrollment's section and course
+        enrollment_rows = db.execute(
+            _PROFILE_ENROLLMENTS_STMT, {"student_id": student_uuid}
+        ).all()
 
         current_enrollment = [
             {
-                "course_code": enrollment.section.course.code,
-                "course_title": enrollment.section.course.title,
-                "section_code": enrollment.section.section_code,
-                "credits": enrollment.section.course.credits,
-                "instructor": enrollment.section.instructor or "TBA",
-                "schedule": enrollment.section.schedule or "TBA"
+                "course_code": row.code,
+                "course_title": row.title,
+                "section_code": row.section_code,
+                "credits": row.credits,
+                "instructor": row.instructor or "TBA",
+                "schedule": "TBA",
             }
-            for enrollment in enrollments
+            for row in enrollment_rows
         ]
 
-        # Get recent requests
-        recent_requests = (
-            db.query(RegistrationRequest)
-            .filter(RegistrationRequest.student_id == UUID(student_id))
-            .order_by(RegistrationRequest.created_at.desc())
-            .limit(10)
-            .all()
-        )
+        # Get recent requests as rows of just the fields reported below
+        recent_requests = db.execute(
+            _PROFILE_REQUESTS_STMT, {"student_id": student_uuid}
+        ).all()
 
         academic_record = {
             "recent_requests": [
@@ -487,8 +540,6 @@ def get_student_profile(student_id: str, advisor_id: str) -> StudentProfileResul
             "general_education_met": "90%"
         }
 
-        db.close()
-
         return StudentProfileResult(
             success=True,
             student_info=student_info,
@@ -507,6 +558,8 @@ def get_student_profile(student_id: str, advisor_id: str) -> StudentProfileResul
             requirements_status={},
             error=f"Error getting student profile: {str(e)}"
         )
+    finally:
+        db.close()
 
 
 @tool
@@ -516,9 +569,8 @@ def get_advisees(advisor_id: str) -> AdviseesResult:
     Args:
         advisor_id: UUID string of the advisor
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
         # Mock implementation - would need proper advisor-student relationships
         advisees = [
             {
@@ -545,8 +597,6 @@ def get_advisees(advisor_id: str) -> AdviseesResult:
 
         active_requests = sum(advisee["pending_requests"] for advisee in advisees)
 
-        db.close()
-
         return AdviseesResult(
             success=True,
             advisees=advisees,
@@ -563,10 +613,34 @@ def get_advisees(advisor_id: str) -> AdviseesResult:
             active_requests=0,
             error=f"Error getting advisees: {str(e)}"
         )
+    finally:
+        release_session(db)
 
 
 # Helper functions for business logic
 
+def _student_summary(student: Student) -> dict[str, Any]:
+    """Summarize the student attached to a pending request."""
+    return {
+        "student_id": str(student.student_id),
+        "external_sis_id": student.external_sis_id,
+        "gpa": float(student.gpa) if student.gpa else None,
+        "standing": student.standing,
+    }
+
+
+def _section_summary(section: Section | None) -> dict[str, Any] | None:
+    """Summarize a request's eager-loaded section and course, or None."""
+    if section is None:
+        return None
+    return {
+        "section_id": str(section.section_id),
+        "course_code": section.course.code,
+        "course_title": section.course.title,
+        "section_code": section.section_code,
+    }
+
+
 def _check_advisor_authorization(advisor_id: str, student_id: str) -> bool:
     """Check if advisor is authorized to access student information."""
     # Would implement proper authorization logic
@@ -6,6 +6,7 @@ from langchain_core.messages import HumanMessage
 from langgraph.prebuilt import create_react_agent
 
 from brs_backend.core.config import get_openai_model
+from brs_backend.database.connection import tool_session
 from brs_backend.agents.department_tools import (
     get_department_requests,
     override_capacity,
@@ -88,9 +89,10 @@ def process_department_request(department_id: str, request: str, context: dict[s
     
     # Process the request
     try:
-        result = agent.invoke({
-            "messages": [HumanMessage(content=message_content)]
-        })
+        with tool_session():
+            result = agent.invoke({
+                "messages": [HumanMessage(content=message_content)]
+            })
         
         # Extract the response
         messages = result.get("messages", [])
@@ -138,9 +140,10 @@ def handle_capacity_override(department_id: str, section_id: str, new_capacity:
     """
     
     try:
-        result = agent.invoke({
-            "messages": [HumanMessage(content=message)]
-        })
+        with tool_session():
+            result = agent.invoke({
+                "messages": [HumanMessage(content=message)]
+            })
         
         messages = result.get("messages", [])
         response = messages[-1].content if messages else "Capacity override processed"
@@ -192,9 +195,10 @@ def get_department_analytics_summary(department_id: str, term_id: str | None = N
     """
     
     try:
-        result = agent.invoke({
-            "messages": [HumanMessage(content=message)]
-        })
+        with tool_session():
+            result = agent.invoke({
+                "messages": [HumanMessage(content=message)]
+            })
         
         messages = result.get("messages", [])
         response = messages[-1].content if messages else "Analytics summary generated"
@@ -244,9 +248,10 @@ def handle_policy_exception(department_id: str, request_id: str, exception_type:
     """
     
     try:
-        result = agent.invoke({
-            "messages": [HumanMessage(content=message)]
-        })
+        with tool_session():
+            result = agent.invoke({
+                "messages": [HumanMessage(content=message)]
+            })
         
         messages = result.get("messages", [])
         response = messages[-1].content if messages else "Policy exception reviewed"
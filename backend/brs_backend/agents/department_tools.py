@@ -1,13 +1,19 @@
 """Department head business logic tools for policy decisions and overrides."""
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID
 
 from langchain_core.tools import tool
 from pydantic import BaseModel, Field
+from sqlalchemy import func
+from sqlalchemy.orm import contains_eager, raiseload, selectinload
 
-from brs_backend.database.connection import SessionLocal
+from brs_backend.database.connection import (
+    SessionLocal,
+    release_session,
+    shared_session,
+)
 from brs_backend.models.database import (
     Course,
     Enrollment,
@@ -94,13 +100,23 @@ def get_department_requests(
         department_id: UUID string of the department
         status_filter: Optional status to filter by (e.g., "pending_department")
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
-        # Get requests requiring department approval
+        # Get requests requiring department approval; students come from the
+        # join and sections/courses are batch-loaded rather than per request
         query = (
             db.query(RegistrationRequest)
             .join(Student, RegistrationRequest.student_id == Student.student_id)
+            .options(
+                contains_eager(RegistrationRequest.student),
+                selectinload(RegistrationRequest.to_section).selectinload(
+                    Section.course
+                ),
+                selectinload(RegistrationRequest.from_section).selectinload(
+                    Section.course
+                ),
+                raiseload("*"),
+            )
             .filter(
                 RegistrationRequest.state.in_(
                     ["advisor_approved", "pending_department"]
@@ -113,25 +129,25 @@ def get_department_requests(
 
         requests = query.all()
 
+        # Registered counts for every requested section in one grouped query
+        to_section_ids = {r.to_section_id for r in requests if r.to_section_id}
+        enrolled_counts = {}
+        if to_section_ids:
+            enrolled_counts = dict(
+                db.query(Enrollment.section_id, func.count(Enrollment.enrollment_id))
+                .filter(
+                    Enrollment.section_id.in_(to_section_ids),
+                    Enrollment.status == "registered",
+                )
+                .group_by(Enrollment.section_id)
+                .all()
+            )
+
         requests_data = []
         for request in requests:
             student = request.student
-            to_section = None
-            from_section = None
-
-            if request.to_section_id:
-                to_section = (
-                    db.query(Section)
-                    .filter(Section.section_id == request.to_section_id)
-                    .first()
-                )
-
-            if request.from_section_id:
-                from_section = (
-                    db.query(Section)
-                    .filter(Section.section_id == request.from_section_id)
-                    .first()
-                )
+            to_section = request.to_section
+            from_section = request.from_section
 
             request_data = {
                 "request_id": str(request.request_id),
@@ -155,12 +171,7 @@ def get_department_requests(
                     "course_title": to_section.course.title,
                     "section_code": to_section.section_code,
                     "capacity": to_section.capacity,
-                    "enrolled": db.query(Enrollment)
-                    .filter(
-                        Enrollment.section_id == to_section.section_id,
-                        Enrollment.status == "registered",
-                    )
-                    .count(),
+                    "enrolled": enrolled_counts.get(to_section.section_id, 0),
                 }
                 if to_section
                 else None,
@@ -178,8 +189,6 @@ def get_department_requests(
 
         pending_count = sum(1 for req in requests_data if req["state"] in ["pending_department", "referred"])
 
-        db.close()
-
         return DepartmentRequestsResult(
             success=True,
             requests=requests_data,
@@ -196,6 +205,8 @@ def get_department_requests(
             pending_count=0,
             error=f"Error getting department requests: {str(e)}"
         )
+    finally:
+        release_session(db)
 
 
 @tool
@@ -210,15 +221,19 @@ def override_capacity(
         department_head_id: UUID string of the department head
         justification: Justification for the override
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
-        section = (
-            db.query(Section).filter(Section.section_id == UUID(section_id)).first()
+        section = db.get(
+            Section,
+            UUID(section_id),
+            options=[selectinload(Section.course), raiseload("*")],
         )
         if not section:
             return {"success": False, "error": "Section not found", "data": None}
 
+        # Read display fields before commit expires the instance
+        course_code = section.course.code
+        section_code = section.section_code
         original_capacity = section.capacity
         section.capacity = new_capacity
 
@@ -229,7 +244,7 @@ def override_capacity(
             "new_capacity": new_capacity,
             "authorized_by": department_head_id,
             "justification": justification,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
         }
 
         db.commit()
@@ -238,8 +253,8 @@ def override_capacity(
             "success": True,
             "data": {
                 "section_id": section_id,
-                "course_code": section.course.code,
-                "section_code": section.section_code,
+                "course_code": course_code,
+                "section_code": section_code,
                 "original_capacity": original_capacity,
                 "new_capacity": new_capacity,
                 "override_log": override_log,
@@ -255,7 +270,7 @@ def override_capacity(
             "data": None,
         }
     finally:
-        db.close()
+        release_session(db)
 
 
 @tool
@@ -269,21 +284,16 @@ def final_approve_request(
         department_head_id: UUID string of the department head
         notes: Optional additional notes
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
-        request = (
-            db.query(RegistrationRequest)
-            .filter(RegistrationRequest.request_id == UUID(request_id))
-            .first()
-        )
+        request = db.get(RegistrationRequest, UUID(request_id))
 
         if not request:
             return {"success": False, "error": "Request not found", "data": None}
 
         request.state = "approved"
         request.department_notes = notes
-        request.final_approved_at = datetime.utcnow()
+        request.final_approved_at = datetime.now(timezone.utc)
 
         db.commit()
 
@@ -306,7 +316,7 @@ def final_approve_request(
             "data": None,
         }
     finally:
-        db.close()
+        release_session(db)
 
 
 @tool
@@ -317,9 +327,8 @@ def get_enrollment_analytics(department_id: str, term_id: str | None = None) ->
         department_id: UUID string of the department
         term_id: Optional term UUID to filter by
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
         # Mock analytics data - would calculate real metrics in production
         analytics = {
             "overview": {
@@ -368,7 +377,7 @@ def get_enrollment_analytics(department_id: str, term_id: str | None = None) ->
             "data": None,
         }
     finally:
-        db.close()
+        release_session(db)
 
 
 @tool
@@ -383,14 +392,9 @@ def manage_policy_exception(
         department_head_id: UUID string of the department head
         rationale: Detailed rationale for the exception
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
-        request = (
-            db.query(RegistrationRequest)
-            .filter(RegistrationRequest.request_id == UUID(request_id))
-            .first()
-        )
+        request = db.get(RegistrationRequest, UUID(request_id))
 
         if not request:
             return {"success": False, "error": "Request not found", "data": None}
@@ -402,7 +406,7 @@ def manage_policy_exception(
             "type": exception_type,
             "granted_by": department_head_id,
             "rationale": rationale,
-            "granted_at": datetime.utcnow().isoformat(),
+            "granted_at": datetime.now(timezone.utc).isoformat(),
             "status": "active",
         }
 
@@ -430,7 +434,7 @@ def manage_policy_exception(
             "data": None,
         }
     finally:
-        db.close()
+        release_session(db)
 
 
 @tool
@@ -441,9 +445,8 @@ def view_department_schedule(department_id: str, term_id: str | None = None) ->
         department_id: UUID string of the department
         term_id: Optional term UUID to filter by
     """
+    db = shared_session() or SessionLocal()
     try:
-        db = SessionLocal()
-
         # Mock schedule data - would query actual department sections
         schedule = {
             "term_info": {
@@ -506,4 +509,4 @@ def view_department_schedule(department_id: str, term_id: str | None = None) ->
             "data": None,
         }
     finally:
-        db.close()
+        release_session(db)
@@ -9,6 +9,7 @@ from langchain_openai import ChatOpenAI
 from langgraph.prebuilt import create_react_agent
 
 from brs_backend.core.config import settings
+from brs_backend.database.connection import tool_session
 from brs_backend.agents.student_tools import (
     get_current_schedule,
     check_course_attachability,
@@ -95,10 +96,12 @@ When enrollment actions are taken, always call get_current_schedule() afterward
     messages.append(HumanMessage(content=message))
 
     # Run the agent - create_react_agent expects {"messages": [...]}
-    result = agent.invoke({"messages": messages})
+    with tool_session():
+        result = agent.invoke({"messages": messages})
 
     # Extract final response
     final_message = result["messages"][-1]
+    timestamp = datetime.now().isoformat()
 
     return {
         "response": final_message.content
@@ -106,6 +109,6 @@ When enrollment actions are taken, always call get_current_schedule() afterward
         else str(final_message),
         "student_id": student_id,
         "conversation_id": str(uuid.uuid4()),
-        "metadata": {"timestamp": datetime.now().isoformat()},
-        "timestamp": datetime.now().isoformat(),
+        "metadata": {"timestamp": timestamp},
+        "timestamp": timestamp,
     }
\ No newline at end of file
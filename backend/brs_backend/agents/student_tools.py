@@ -1,76 +1,316 @@
 """LangGraph student tools - Business logic and database operations."""
 
+import itertools
+import os
+import time
 import uuid
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
 from langchain_core.tools import tool
-from sqlalchemy import text
+from sqlalchemy import bindparam, event, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import SQLAlchemyError
 
-from brs_backend.database.connection import get_db
+from brs_backend.database.connection import ro_conn, tool_db
+from brs_backend.models.database import Enrollment, Section, SectionMeeting
 from brs_backend.models.tool_outputs import (
     AttachabilityResponse,
     ConflictItem,
     EnrollmentResponse,
+    ScheduleDelta,
     ScheduleItem,
     StudentSchedule,
     Violation,
 )
+from brs_backend.utils.cache import TTLCache
 from brs_backend.utils.calendar_utils import get_term_dates
+from brs_backend.utils.notifications import notification_batcher
 
+logger = logging.getLogger(__name__)
 
-@tool
-def get_current_schedule(
-    student_id: str, format_type: str = "structured"
-) -> StudentSchedule:
-    """Get current schedule for a student with structured format.
-
-    Args:
-        student_id: ID of the student
-        format_type: Format type ('structured', 'ical', 'basic')
-
-    Returns:
-        StudentSchedule with detailed course information
+# Student's enrolled sections; shared by the tool and post-enrollment refresh.
+# Meetings come from _meetings_for_sections so they can be cached per section
+_SCHEDULE_SQL = text(
     """
-    db = next(get_db())
-
-    query = """
     SELECT
+        s.section_id,
         c.code as course_code,
         c.title as course_title,
         s.section_code,
         c.credits,
         i.name as instructor,
-        sm.day_of_week,
-        sm.time_range,
-        cr.name as room_name,
-        sm.activity,
         'enrolled' as status
     FROM enrollment e
     JOIN section s ON e.section_id = s.section_id
     JOIN course c ON s.course_id = c.course_id
     JOIN instructor i ON s.instructor_id = i.instructor_id
-    LEFT JOIN section_meeting sm ON s.section_id = sm.section_id
+    WHERE e.student_id = :student_id
+    ORDER BY c.code, s.section_code
+    """
+)
+
+# Schedule entries for sections just enrolled in, for the enrollment delta
+_SECTION_ENTRIES_SQL = text(
+    """
+    SELECT
+        s.section_id,
+        c.code as course_code,
+        c.title as course_title,
+        s.section_code,
+        c.credits,
+        i.name as instructor
+    FROM section s
+    JOIN course c ON s.course_id = c.course_id
+    JOIN instructor i ON s.instructor_id = i.instructor_id
+    WHERE s.section_id IN :section_ids
+    ORDER BY c.code, s.section_code
+    """
+).bindparams(bindparam("section_ids", expanding=True))
+
+# Meetings and rooms for a batch of sections
+_SECTION_MEETINGS_SQL = text(
+    """
+    SELECT
+        sm.section_id,
+        sm.day_of_week,
+        to_char(lower(sm.time_range), 'HH24:MI:SS') as start_time,
+        to_char(upper(sm.time_range), 'HH24:MI:SS') as end_time,
+        cr.name as room_name
+    FROM section_meeting sm
     LEFT JOIN campus_room cr ON sm.room_id = cr.room_id
+    WHERE sm.section_id IN :section_ids
+    ORDER BY sm.section_id, sm.day_of_week, sm.time_range
+    """
+).bindparams(bindparam("section_ids", expanding=True))
+
+# Credit and course totals for the same enrollments, without the meeting rows
+_SCHEDULE_TOTALS_SQL = text(
+    """
+    SELECT
+        COALESCE(SUM(c.credits), 0) as total_credits,
+        COUNT(*) as course_count
+    FROM enrollment e
+    JOIN section s ON e.section_id = s.section_id
+    JOIN course c ON s.course_id = c.course_id
     WHERE e.student_id = :student_id
-    ORDER BY c.code, sm.day_of_week, sm.time_range
     """
+)
+
+# Meetings of the candidate sections that overlap one of the student's
+# registered meetings: same day and overlapping TSRANGE, so the GiST index on
+# (day_of_week, time_range) can serve the check
+_SECTION_CONFLICTS_SQL = text(
+    """
+    SELECT DISTINCT tm.section_id, tm.day_of_week, c.code as course_code
+    FROM section_meeting tm
+    JOIN section_meeting cm
+      ON cm.day_of_week = tm.day_of_week AND cm.time_range && tm.time_range
+    JOIN enrollment e ON e.section_id = cm.section_id
+    JOIN section s ON cm.section_id = s.section_id
+    JOIN course c ON s.course_id = c.course_id
+    WHERE tm.section_id IN :section_ids
+      AND e.student_id = :student_id AND e.status = 'registered'
+    """
+).bindparams(bindparam("section_ids", expanding=True))
+
+# Section row shared by the attachability check and enrollment, with its
+# registered head count and whether the student already holds any section
+# of the course
+_ATTACHABILITY_SQL = text(
+    """
+    SELECT s.section_id, s.capacity, c.title, c.credits, c.department_id,
+           i.name as instructor,
+           (SELECT COUNT(*) FROM enrollment e
+            WHERE e.section_id = s.section_id
+              AND e.status = 'registered') as enrolled_count,
+           EXISTS (
+               SELECT 1 FROM enrollment e
+               JOIN section es ON e.section_id = es.section_id
+               JOIN course ec ON es.course_id = ec.course_id
+               WHERE e.student_id = :student_id AND ec.code = :course_code
+           ) as already_enrolled
+    FROM section s
+    JOIN course c ON s.course_id = c.course_id
+    LEFT JOIN instructor i ON s.instructor_id = i.instructor_id
+    WHERE c.code = :course_code AND s.section_code = :section_code
+    """
+)
+
+# First prerequisite of a course the student has not completed; prerequisite
+# enrollments are matched by course code as codes repeat across campuses
+_MISSING_PREREQ_SQL = text(
+    """
+    SELECT c2.code as prereq_code,
+           COALESCE(bool_or(pe.status = 'registered'), false) as currently_enrolled
+    FROM course_prereq cp
+    JOIN course c1 ON cp.course_id = c1.course_id
+    JOIN course c2 ON cp.req_course_id = c2.course_id
+    LEFT JOIN (
+        SELECT c.code, e.status
+        FROM enrollment e
+        JOIN section s ON e.section_id = s.section_id
+        JOIN course c ON s.course_id = c.course_id
+        WHERE e.student_id = :student_id
+          AND e.status IN ('completed', 'registered')
+    ) pe ON pe.code = c2.code
+    WHERE c1.code = :course_code
+    GROUP BY c2.code
+    HAVING NOT COALESCE(bool_or(pe.status = 'completed'), false)
+    LIMIT 1
+    """
+)
+
+# Delete one of the student's enrollments in a course and return it, so
+# drop_course finds and removes the row in a single round trip
+_DROP_ENROLLMENT_SQL = text(
+    """
+    DELETE FROM enrollment
+    WHERE enrollment_id = (
+        SELECT e.enrollment_id FROM enrollment e
+        JOIN section s ON e.section_id = s.section_id
+        JOIN course c ON s.course_id = c.course_id
+        WHERE e.student_id = :student_id AND c.code = :course_code
+        LIMIT 1
+    )
+    RETURNING enrollment_id, section_id
+    """
+)
+
+# Other sections of a course that still have seats
+_ALTERNATIVE_SECTIONS_SQL = text(
+    """
+    SELECT s.section_id, s.section_code, s.capacity,
+           COUNT(e.enrollment_id) as current_enrollment
+    FROM section s
+    JOIN course c ON s.course_id = c.course_id
+    LEFT JOIN enrollment e ON s.section_id = e.section_id AND e.status = 'registered'
+    WHERE c.code = :course_code AND s.section_code != :requested_section
+    GROUP BY s.section_id, s.section_code, s.capacity
+    HAVING COUNT(e.enrollment_id) < s.capacity
+    ORDER BY s.section_code
+    """
+)
+
+
+# Indexed by section_meeting.day_of_week (0 = Monday)
+_DAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+# Prerequisite results by (student_id, course_code): a (prereq_code,
+# currently_enrolled) tuple, or None when nothing is missing. A student's
+# completed courses do not change during a registration session
+_PREREQ_CACHE = TTLCache(maxsize=10_000, ttl=60.0)
+
+# Distinguishes "not cached" from a cached None
+_UNCACHED = object()
+
+# Serialized meetings per section ({str(section_id): [meeting dict]}); section
+# meetings rarely change within a term and ORM writes invalidate the entry
+_MEETINGS_CACHE = TTLCache(maxsize=4096, ttl=300.0)
 
-    result = db.execute(text(query), {"student_id": student_id})
+# Catalog search results by (query, department, level), stored as a tuple so
+# callers get copies; seat counts may lag by up to the TTL, and enroll/drop
+# and ORM section updates (capacity overrides) in this process clear the cache
+_CATALOG_CACHE = TTLCache(maxsize=256, ttl=60.0)
+
+# Rows fetched per round trip when streaming the course catalog
+_CATALOG_BATCH = 200
+
+# Shared empty conflict list for EnrollmentResponse; the field is an immutable tuple
+_NO_CONFLICTS: tuple[ConflictItem, ...] = ()
+
+# Department notifications run off the request path; each job opens its own session
+_NOTIFY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="brs-notify")
+
+# Recently sent (student_id, course_code, reason) notifications, so a student
+# retrying the same failed enrollment does not notify the department each time
+_NOTIFY_DEDUP_SECONDS = 60.0
+_NOTIFY_SEEN_MAX = 4096
+_NOTIFY_SEEN: dict[tuple[str, str, str], float] = {}
+_NOTIFY_SEEN_LOCK = threading.Lock()
+
+
+# Process-local transaction counter, seeded from the clock; the pid prefix keeps
+# ids distinct across worker processes
+_TXN_PREFIX = f"{os.getpid():x}-"
+_TXN_SEQ = itertools.count(time.time_ns()).__next__
+
+
+def _normalize_course_code(course_code: str) -> str:
+    """Return the stored form of a course code ("cs101 " -> "CS101").
+
+    Codes are stored upper-case, so normalizing the input keeps exact-match
+    lookups on the plain course_code_idx instead of needing ILIKE or upper().
+    """
+    return course_code.strip().upper()
+
+
+def _new_transaction_id() -> str:
+    """Return a fresh transaction identifier for enrollment responses."""
+    return _TXN_PREFIX + format(_TXN_SEQ(), "016x")
+
+
+@tool
+def get_current_schedule(
+    student_id: str, format_type: str = "structured", summary_only: bool = False
+) -> StudentSchedule:
+    """Get current schedule for a student with structured format.
+
+    Args:
+        student_id: ID of the student
+        format_type: Format type ('structured', 'ical', 'basic')
+        summary_only: Return only credit and course totals, with an empty schedule
+
+    Returns:
+        StudentSchedule with detailed course information
+    """
+    with ro_conn() as db:
+        return _build_schedule(db, student_id, summary_only=summary_only)
+
+
+def _build_schedule(
+    db, student_id: str, summary_only: bool = False
+) -> StudentSchedule:
+    """Build a student's schedule using the caller's session."""
+    if summary_only:
+        totals = db.execute(_SCHEDULE_TOTALS_SQL, {"student_id": student_id}).one()
+        return StudentSchedule(
+            student_id=student_id,
+            term_id="fall_2024",
+            schedule=[],
+            total_credits=totals.total_credits,
+            pending_credits=0,
+            course_count=totals.course_count,
+            pending_count=0,
+        )
+
+    result = db.execute(_SCHEDULE_SQL, {"student_id": student_id})
     rows = result.fetchall()
 
     if not rows:
         return StudentSchedule(
             student_id=student_id,
+            term_id="fall_2024",
             schedule=[],
             total_credits=0,
+            pending_credits=0,
             course_count=0,
-            term="Fall 2024",
-            last_updated=datetime.now(),
+            pending_count=0,
         )
 
-    # Group by course
+    meetings = _meetings_for_sections(db, [row.section_id for row in rows])
+
     courses = {}
     total_credits = 0
 
@@ -85,51 +325,12 @@ def get_current_schedule(
                 "credits": row.credits,
                 "instructor": row.instructor,
                 "status": row.status,
-                "meetings": [],
+                "meetings": meetings[str(row.section_id)],
             }
             total_credits += row.credits
 
-        if row.day_of_week is not None:
-            # Parse time_range (TSRANGE format: [HH:MM:SS,HH:MM:SS))
-            start_time = end_time = "TBD"
-            if row.time_range:
-                time_str = str(row.time_range)
-                # Extract times from TSRANGE format like [09:00:00,10:30:00)
-                if "," in time_str:
-                    times = time_str.strip("[]()").split(",")
-                    if len(times) == 2:
-                        start_time = times[0].strip()
-                        end_time = times[1].strip()
-
-            meeting = {
-                "day": [
-                    "Monday",
-                    "Tuesday",
-                    "Wednesday",
-                    "Thursday",
-                    "Friday",
-                    "Saturday",
-                    "Sunday",
-                ][row.day_of_week],
-                "start_time": start_time,
-                "end_time": end_time,
-                "room": row.room_name if row.room_name else "TBD",
-            }
-            courses[course_key]["meetings"].append(meeting)
-
-    # Convert to ScheduleItem objects
-    schedule_items = []
-    for course_data in courses.values():
-        item = ScheduleItem(
-            course_code=course_data["course_code"],
-            course_title=course_data["course_title"],
-            section_code=course_data["section_code"],
-            credits=course_data["credits"],
-            instructor=course_data["instructor"],
-            status=course_data["status"],
-            meetings=course_data["meetings"],
-        )
-        schedule_items.append(item)
+    # Convert to ScheduleItem objects; the grouped dicts carry exactly its fields
+    schedule_items = [ScheduleItem(**course_data) for course_data in courses.values()]
 
     return StudentSchedule(
         student_id=student_id,
@@ -142,6 +343,77 @@ def get_current_schedule(
     )
 
 
+def _meetings_for_sections(db, section_ids) -> dict[str, list[dict]]:
+    """Return serialized meetings keyed by section id, reading only cache misses."""
+    meetings = {}
+    missing = []
+    for section_id in section_ids:
+        key = str(section_id)
+        cached = _MEETINGS_CACHE.get(key)
+        if cached is None:
+            missing.append(key)
+        else:
+            meetings[key] = cached
+
+    if missing:
+        loaded = {key: [] for key in missing}
+        rows = db.execute(_SECTION_MEETINGS_SQL, {"section_ids": missing})
+        for row in rows:
+            loaded[str(row.section_id)].append(
+                {
+                    "day": _DAY_NAMES[row.day_of_week],
+                    "start_time": row.start_time or "TBD",
+                    "end_time": row.end_time or "TBD",
+                    "room": row.room_name or "TBD",
+                }
+            )
+        for key, section_meetings in loaded.items():
+            _MEETINGS_CACHE.set(key, section_meetings)
+        meetings.update(loaded)
+
+    return meetings
+
+
+@event.listens_for(SectionMeeting, "after_insert")
+@event.listens_for(SectionMeeting, "after_update")
+@event.listens_for(SectionMeeting, "after_delete")
+def _invalidate_section_meetings(mapper, connection, target) -> None:
+    """Drop a section's cached meetings when one of its meetings changes."""
+    _MEETINGS_CACHE.pop(str(target.section_id))
+
+
+@event.listens_for(Section, "after_update")
+def _invalidate_catalog(mapper, connection, target) -> None:
+    """Drop cached catalog searches when a section (e.g. its capacity) changes."""
+    _CATALOG_CACHE.clear()
+
+
+def _missing_prerequisite(db, student_id: str, course_code: str):
+    """Return (prereq_code, currently_enrolled) for the first prerequisite the
+    student has not completed, or None.
+
+    Results are cached per student and course for a short time; enrolling or
+    dropping invalidates the student's entries.
+    """
+    key = (str(student_id), course_code)
+    cached = _PREREQ_CACHE.get(key, _UNCACHED)
+    if cached is not _UNCACHED:
+        return cached
+
+    row = db.execute(
+        _MISSING_PREREQ_SQL, {"student_id": student_id, "course_code": course_code}
+    ).fetchone()
+    missing_prereq = None if row is None else (row.prereq_code, row.currently_enrolled)
+    _PREREQ_CACHE.set(key, missing_prereq)
+    return missing_prereq
+
+
+def _forget_prerequisites(student_id: str) -> None:
+    """Drop a student's cached prerequisite results after enroll or drop."""
+    student_key = str(student_id)
+    _PREREQ_CACHE.pop_where(lambda key: key[0] == student_key)
+
+
 @tool
 def check_course_attachability(
     student_id: str, course_code: str, section_code: str
@@ -156,29 +428,28 @@ def check_course_attachability(
     Returns:
         AttachabilityResponse with enrollment eligibility details
     """
-    db = next(get_db())
-
-    # Get section details
-    section_query = """
-    SELECT s.section_id, s.capacity, c.title, c.credits,
-           i.name as instructor,
-           COALESCE(e.enrolled_count, 0) as enrolled_count
-    FROM section s
-    JOIN course c ON s.course_id = c.course_id
-    JOIN instructor i ON s.instructor_id = i.instructor_id
-    LEFT JOIN (
-        SELECT section_id, COUNT(*) as enrolled_count
-        FROM enrollment
-        GROUP BY section_id
-    ) e ON s.section_id = e.section_id
-    WHERE c.code = :course_code AND s.section_code = :section_code
-    """
+    course_code = _normalize_course_code(course_code)
+    with ro_conn() as db:
+        section = _load_section(db, student_id, course_code, section_code)
+        return _check_attachability(db, student_id, course_code, section_code, section)
+
+
+def _load_section(db, student_id: str, course_code: str, section_code: str):
+    """Fetch section details, head count and existing-enrollment flag, or None."""
+    return db.execute(
+        _ATTACHABILITY_SQL,
+        {
+            "student_id": student_id,
+            "course_code": course_code,
+            "section_code": section_code,
+        },
+    ).fetchone()
 
-    result = db.execute(
-        text(section_query), {"course_code": course_code, "section_code": section_code}
-    )
-    section = result.fetchone()
 
+def _check_attachability(
+    db, student_id: str, course_code: str, section_code: str, section
+) -> AttachabilityResponse:
+    """Run the attachability check for a section row from _load_section."""
     if not section:
         return AttachabilityResponse(
             success=False,
@@ -216,90 +487,41 @@ def check_course_attachability(
             ],
         )
 
-    # Check prerequisites FIRST - students must complete required courses before enrolling
-    prereq_query = """
-    SELECT c2.code as prereq_code, cp.type
-    FROM course_prereq cp
-    JOIN course c1 ON cp.course_id = c1.course_id
-    JOIN course c2 ON cp.req_course_id = c2.course_id
-    WHERE c1.code = :course_code
-    """
-
-    result = db.execute(text(prereq_query), {"course_code": course_code})
-    prerequisites = result.fetchall()
-
-    if prerequisites:
-        # Check if student has completed all prerequisites
-        for prereq in prerequisites:
-            # Check if student has completed this prerequisite course
-            completed_query = """
-            SELECT 1 FROM enrollment e
-            JOIN section s ON e.section_id = s.section_id
-            JOIN course c ON s.course_id = c.course_id
-            WHERE e.student_id = :student_id AND c.code = :prereq_code AND e.status = 'completed'
-            """
-
-            result = db.execute(
-                text(completed_query),
-                {"student_id": student_id, "prereq_code": prereq.prereq_code},
-            )
-            completed = result.fetchone()
-
-            if not completed:
-                # Check if student is currently enrolled (but not completed)
-                enrolled_query = """
-                SELECT 1 FROM enrollment e
-                JOIN section s ON e.section_id = s.section_id
-                JOIN course c ON s.course_id = c.course_id
-                WHERE e.student_id = :student_id AND c.code = :prereq_code AND e.status = 'registered'
-                """
-
-                result = db.execute(
-                    text(enrolled_query),
-                    {"student_id": student_id, "prereq_code": prereq.prereq_code},
-                )
-                currently_enrolled = result.fetchone()
+    # Check prerequisites FIRST - students must complete required courses before enrolling.
+    # One query returns the first prerequisite the student has not completed,
+    # flagged if they are currently registered in it
+    missing_prereq = _missing_prerequisite(db, student_id, course_code)
 
-                if currently_enrolled:
-                    reason = f"Prerequisite {prereq.prereq_code} must be completed before enrolling in {course_code}. You are currently enrolled in {prereq.prereq_code} but have not yet completed it."
-                else:
-                    reason = f"Missing prerequisite: {prereq.prereq_code} must be completed before enrolling in {course_code}"
+    if missing_prereq:
+        prereq_code, currently_enrolled = missing_prereq
+        if currently_enrolled:
+            reason = f"Prerequisite {prereq_code} must be completed before enrolling in {course_code}. You are currently enrolled in {prereq_code} but have not yet completed it."
+        else:
+            reason = f"Missing prerequisite: {prereq_code} must be completed before enrolling in {course_code}"
 
-                return AttachabilityResponse(
-                    success=False,
-                    attachable=False,
-                    reason=reason,
-                    section_info={
-                        "course_code": course_code,
-                        "section_code": section_code,
-                        "title": section.title,
-                        "available": False,
-                    },
-                    conflicts=[],
-                    recommendations=[f"Complete {prereq.prereq_code} first"],
-                    violations=[
-                        Violation(
-                            rule_code="PREREQUISITE_NOT_COMPLETED",
-                            message=f"Prerequisite {prereq.prereq_code} not completed",
-                            severity="error",
-                        )
-                    ],
+        return AttachabilityResponse(
+            success=False,
+            attachable=False,
+            reason=reason,
+            section_info={
+                "course_code": course_code,
+                "section_code": section_code,
+                "title": section.title,
+                "available": False,
+            },
+            conflicts=[],
+            recommendations=[f"Complete {prereq_code} first"],
+            violations=[
+                Violation(
+                    rule_code="PREREQUISITE_NOT_COMPLETED",
+                    message=f"Prerequisite {prereq_code} not completed",
+                    severity="error",
                 )
+            ],
+        )
 
     # Check for existing enrollment
-    enrollment_query = """
-    SELECT 1 FROM enrollment e
-    JOIN section s ON e.section_id = s.section_id
-    JOIN course c ON s.course_id = c.course_id
-    WHERE e.student_id = :student_id AND c.code = :course_code
-    """
-
-    result = db.execute(
-        text(enrollment_query), {"student_id": student_id, "course_code": course_code}
-    )
-    existing = result.fetchone()
-
-    if existing:
+    if section.already_enrolled:
         return AttachabilityResponse(
             success=False,
             attachable=False,
@@ -314,20 +536,6 @@ def check_course_attachability(
             recommendations=["Drop current section before enrolling in new one"],
         )
 
-    # Check for schedule conflicts
-    current_schedule = get_current_schedule.invoke({"student_id": student_id})
-    conflicts = []
-
-    # Get meeting times for the target section
-    meeting_query = """
-    SELECT day_of_week, time_range, room_id, activity
-    FROM section_meeting
-    WHERE section_id = :section_id
-    """
-
-    result = db.execute(text(meeting_query), {"section_id": section.section_id})
-    target_meetings = result.fetchall()
-
     # Check conflicts with current schedule (simplified for now)
     conflicts = []
     # TODO: Implement proper time conflict checking with time_range fields
@@ -386,165 +594,132 @@ def enroll_in_course(
         auto_resolve_conflicts: Whether to automatically find alternative sections if conflicts exist
 
     Returns:
-        EnrollmentResponse with enrollment result and updated schedule
+        EnrollmentResponse with the enrollment result: the new schedule entries
+        on success, the current schedule on failure
     """
-    db = next(get_db())
-
-    # Step 1: Perform attachability check if requested (prerequisites + basic validation)
-    if auto_check:
-        attachability = check_course_attachability.invoke(
-            {
-                "student_id": student_id,
-                "course_code": course_code,
-                "section_code": section_code,
-            }
-        )
-        if not attachability.attachable:
-            return EnrollmentResponse(
-                success=False,
-                message=f"Cannot enroll: {attachability.reason}",
-                enrollment_id=None,
-                updated_schedule=get_current_schedule.invoke(
-                    {"student_id": student_id}
-                ),
-                conflicts=attachability.conflicts,
-                transaction_id=str(uuid.uuid4()),
+    course_code = _normalize_course_code(course_code)
+    with tool_db() as db:
+        # The section row is loaded once and shared by the attachability check
+        # and the capacity/conflict steps below
+        section = _load_section(db, student_id, course_code, section_code)
+
+        # Step 1: Perform attachability check if requested (prerequisites + basic validation)
+        if auto_check:
+            attachability = _check_attachability(
+                db, student_id, course_code, section_code, section
             )
+            if not attachability.attachable:
+                return EnrollmentResponse(
+                    success=False,
+                    message=f"Cannot enroll: {attachability.reason}",
+                    enrollment_id=None,
+                    updated_schedule=_build_schedule(db, student_id),
+                    conflicts=attachability.conflicts,
+                    transaction_id=_new_transaction_id(),
+                )
 
-    try:
-        # Step 2: Get requested section details
-        section_query = """
-        SELECT s.section_id, c.credits, c.title, s.capacity,
-               COUNT(e.enrollment_id) as current_enrollment
-        FROM section s
-        JOIN course c ON s.course_id = c.course_id
-        LEFT JOIN enrollment e ON s.section_id = e.section_id AND e.status = 'registered'
-        WHERE c.code = :course_code AND s.section_code = :section_code
-        GROUP BY s.section_id, c.credits, c.title, s.capacity
-        """
+        try:
+            # Step 2: Requested section details come from the row loaded above
+            if not section:
+                return EnrollmentResponse(
+                    success=False,
+                    message="Course section not found",
+                    enrollment_id=None,
+                    updated_schedule=_build_schedule(db, student_id),
+                    conflicts=_NO_CONFLICTS,
+                    transaction_id=_new_transaction_id(),
+                )
 
-        result = db.execute(
-            text(section_query),
-            {"course_code": course_code, "section_code": section_code},
-        )
-        section = result.fetchone()
+            # Step 3: Check if requested section has capacity
+            if section.enrolled_count >= section.capacity:
+                if auto_resolve_conflicts:
+                    # Find alternative sections with capacity
+                    alternative_section = _find_alternative_section(
+                        db, student_id, course_code, section_code
+                    )
+                    if alternative_section:
+                        return _enroll_in_alternative_section(
+                            db, student_id, course_code, alternative_section
+                        )
+                    else:
+                        # Notify department head - all sections full
+                        _NOTIFY_POOL.submit(
+                            _notify_department_head_detached,
+                            student_id,
+                            course_code,
+                            "ALL_SECTIONS_FULL",
+                            department_id=section.department_id,
+                        )
 
-        if not section:
-            return EnrollmentResponse(
-                success=False,
-                message="Course section not found",
-                enrollment_id=None,
-                updated_schedule=get_current_schedule.invoke(
-                    {"student_id": student_id}
-                ),
-                conflicts=[],
-                transaction_id=str(uuid.uuid4()),
-            )
+                return EnrollmentResponse(
+                    success=False,
+                    message=f"Section {section_code} is full. All sections for {course_code} are at capacity.",
+                    enrollment_id=None,
+                    updated_schedule=_build_schedule(db, student_id),
+                    conflicts=_NO_CONFLICTS,
+                    transaction_id=_new_transaction_id(),
+                )
 
-        # Step 3: Check if requested section has capacity
-        if section.current_enrollment >= section.capacity:
-            if auto_resolve_conflicts:
-                # Find alternative sections with capacity
+            # Step 4: Check for time conflicts with current schedule
+            conflicts = _check_time_conflicts(db, student_id, section.section_id)
+
+            if conflicts and auto_resolve_conflicts:
+                # Find alternative sections without conflicts
                 alternative_section = _find_alternative_section(
-                    db, student_id, course_code, section_code
+                    db, student_id, course_code, section_code, avoid_conflicts=True
                 )
                 if alternative_section:
                     return _enroll_in_alternative_section(
-                        db, student_id, course_code, alternative_section
+                        db,
+                        student_id,
+                        course_code,
+                        alternative_section,
+                        original_request=f"{course_code} {section_code}",
                     )
                 else:
-                    # Notify department head - all sections full
-                    _notify_department_head(
-                        db, student_id, course_code, "ALL_SECTIONS_FULL"
+                    # Notify department head - conflicts prevent enrollment
+                    _NOTIFY_POOL.submit(
+                        _notify_department_head_detached,
+                        student_id,
+                        course_code,
+                        "SCHEDULE_CONFLICTS",
+                        department_id=section.department_id,
                     )
 
-            return EnrollmentResponse(
-                success=False,
-                message=f"Section {section_code} is full. All sections for {course_code} are at capacity.",
-                enrollment_id=None,
-                updated_schedule=get_current_schedule.invoke(
-                    {"student_id": student_id}
-                ),
-                conflicts=[],
-                transaction_id=str(uuid.uuid4()),
-            )
-
-        # Step 4: Check for time conflicts with current schedule
-        conflicts = _check_time_conflicts(db, student_id, section.section_id)
-
-        if conflicts and auto_resolve_conflicts:
-            # Find alternative sections without conflicts
-            alternative_section = _find_alternative_section(
-                db, student_id, course_code, section_code, avoid_conflicts=True
-            )
-            if alternative_section:
-                return _enroll_in_alternative_section(
-                    db,
-                    student_id,
-                    course_code,
-                    alternative_section,
-                    original_request=f"{course_code} {section_code}",
-                )
-            else:
-                # Notify department head - conflicts prevent enrollment
-                _notify_department_head(
-                    db, student_id, course_code, "SCHEDULE_CONFLICTS"
-                )
-
+                    return EnrollmentResponse(
+                        success=False,
+                        message=f"Time conflict detected with {course_code} {section_code}. No alternative sections available without conflicts.",
+                        enrollment_id=None,
+                        updated_schedule=_build_schedule(db, student_id),
+                        conflicts=_conflict_items(conflicts, course_code),
+                        transaction_id=_new_transaction_id(),
+                    )
+            elif conflicts:
                 return EnrollmentResponse(
                     success=False,
-                    message=f"Time conflict detected with {course_code} {section_code}. No alternative sections available without conflicts.",
+                    message=f"Time conflict detected with {course_code} {section_code}",
                     enrollment_id=None,
-                    updated_schedule=get_current_schedule.invoke(
-                        {"student_id": student_id}
-                    ),
-                    conflicts=[
-                        ConflictItem(
-                            type="time_conflict",
-                            description=conf["description"],
-                            course_code=course_code,
-                            day=conf.get("day"),
-                        )
-                        for conf in conflicts
-                    ],
-                    transaction_id=str(uuid.uuid4()),
+                    updated_schedule=_build_schedule(db, student_id),
+                    conflicts=_conflict_items(conflicts, course_code),
+                    transaction_id=_new_transaction_id(),
                 )
-        elif conflicts:
+
+            # Step 5: Proceed with enrollment in requested section
+            return _complete_enrollment(
+                db, student_id, section.section_id, f"{course_code} {section_code}"
+            )
+
+        except Exception as e:
+            db.rollback()
             return EnrollmentResponse(
                 success=False,
-                message=f"Time conflict detected with {course_code} {section_code}",
+                message=f"Enrollment failed: {str(e)}",
                 enrollment_id=None,
-                updated_schedule=get_current_schedule.invoke(
-                    {"student_id": student_id}
-                ),
-                conflicts=[
-                    ConflictItem(
-                        type="time_conflict",
-                        description=conf["description"],
-                        course_code=course_code,
-                        day=conf.get("day"),
-                    )
-                    for conf in conflicts
-                ],
-                transaction_id=str(uuid.uuid4()),
+                updated_schedule=_build_schedule(db, student_id),
+                conflicts=_NO_CONFLICTS,
+                transaction_id=_new_transaction_id(),
             )
 
-        # Step 5: Proceed with enrollment in requested section
-        return _complete_enrollment(
-            db, student_id, section.section_id, f"{course_code} {section_code}"
-        )
-
-    except Exception as e:
-        db.rollback()
-        return EnrollmentResponse(
-            success=False,
-            message=f"Enrollment failed: {str(e)}",
-            enrollment_id=None,
-            updated_schedule=get_current_schedule.invoke({"student_id": student_id}),
-            conflicts=[],
-            transaction_id=str(uuid.uuid4()),
-        )
-
 
 @tool
 def drop_course(student_id: str, course_code: str) -> EnrollmentResponse:
@@ -557,64 +732,53 @@ def drop_course(student_id: str, course_code: str) -> EnrollmentResponse:
     Returns:
         EnrollmentResponse with drop result and updated schedule
     """
-    db = next(get_db())
+    course_code = _normalize_course_code(course_code)
+    with tool_db() as db:
+        try:
+            # Find and delete the enrollment in one statement
+            enrollment = db.execute(
+                _DROP_ENROLLMENT_SQL,
+                {"student_id": student_id, "course_code": course_code},
+            ).fetchone()
+
+            if not enrollment:
+                return EnrollmentResponse(
+                    success=False,
+                    message=f"Not enrolled in {course_code}",
+                    enrollment_id=None,
+                    updated_schedule=_build_schedule(db, student_id),
+                    conflicts=_NO_CONFLICTS,
+                    transaction_id=_new_transaction_id(),
+                )
 
-    try:
-        # Find enrollment
-        enrollment_query = """
-        SELECT e.enrollment_id, s.section_id FROM enrollment e
-        JOIN section s ON e.section_id = s.section_id
-        JOIN course c ON s.course_id = c.course_id
-        WHERE e.student_id = :student_id AND c.code = :course_code
-        """
+            # No need to update enrolled count - it's calculated dynamically
 
-        result = db.execute(
-            text(enrollment_query),
-            {"student_id": student_id, "course_code": course_code},
-        )
-        enrollment = result.fetchone()
+            # Read the updated schedule inside the same transaction and session
+            updated_schedule = _build_schedule(db, student_id)
+            db.commit()
+            _forget_prerequisites(student_id)
+            _CATALOG_CACHE.clear()
 
-        if not enrollment:
+            return EnrollmentResponse(
+                success=True,
+                message=f"Successfully dropped {course_code}",
+                enrollment_id=str(enrollment.enrollment_id),
+                updated_schedule=updated_schedule,
+                conflicts=_NO_CONFLICTS,
+                transaction_id=_new_transaction_id(),
+            )
+
+        except Exception as e:
+            db.rollback()
             return EnrollmentResponse(
                 success=False,
-                message=f"Not enrolled in {course_code}",
+                message=f"Drop failed: {str(e)}",
                 enrollment_id=None,
-                updated_schedule=get_current_schedule(student_id),
-                conflicts=[],
-                transaction_id=str(uuid.uuid4()),
+                updated_schedule=_build_schedule(db, student_id),
+                conflicts=_NO_CONFLICTS,
+                transaction_id=_new_transaction_id(),
             )
 
-        # Delete enrollment
-        delete_query = "DELETE FROM enrollment WHERE enrollment_id = :enrollment_id"
-        db.execute(text(delete_query), {"enrollment_id": enrollment.enrollment_id})
-
-        # No need to update enrolled count - it's calculated dynamically
-
-        db.commit()
-
-        # Get updated schedule
-        updated_schedule = get_current_schedule(student_id)
-
-        return EnrollmentResponse(
-            success=True,
-            message=f"Successfully dropped {course_code}",
-            enrollment_id=enrollment.enrollment_id,
-            updated_schedule=updated_schedule,
-            conflicts=[],
-            transaction_id=str(uuid.uuid4()),
-        )
-
-    except Exception as e:
-        db.rollback()
-        return EnrollmentResponse(
-            success=False,
-            message=f"Drop failed: {str(e)}",
-            enrollment_id=None,
-            updated_schedule=get_current_schedule(student_id),
-            conflicts=[],
-            transaction_id=str(uuid.uuid4()),
-        )
-
 
 @tool
 def get_schedule_ical(student_id: str) -> dict[str, Any]:
@@ -657,7 +821,10 @@ def search_available_courses(
     Returns:
         List of available course information
     """
-    db = next(get_db())
+    cache_key = (query, department, level)
+    cached = _CATALOG_CACHE.get(cache_key)
+    if cached is not None:
+        return [dict(course) for course in cached]
 
     base_query = """
     SELECT DISTINCT c.code, c.title, c.credits, c.level, c.course_type,
@@ -676,27 +843,31 @@ def search_available_courses(
     """
 
     conditions = []
-    params = []
+    params = {}
 
     if query:
-        conditions.append("(c.title ILIKE %s OR c.code ILIKE %s)")
-        params.extend([f"%{query}%", f"%{query}%"])
+        conditions.append("(c.title ILIKE :pattern OR c.code ILIKE :pattern)")
+        params["pattern"] = f"%{query}%"
 
     if level:
-        conditions.append("c.level = %s")
-        params.append(int(level))
+        conditions.append("c.level = :level")
+        params["level"] = int(level)
 
     if conditions:
         base_query += " AND " + " AND ".join(conditions)
 
     base_query += " ORDER BY c.code"
 
-    result = db.execute(text(base_query), params)
-    rows = result.fetchall()
+    # Not on ro_conn(): psycopg2 only opens the server-side cursor that
+    # yield_per streams from inside a transaction. Cache hits skip the query
+    with tool_db() as db:
+        # Stream rows from a server-side cursor in batches rather than buffering
+        # the whole catalog before building the response
+        result = db.execute(
+            text(base_query), params, execution_options={"yield_per": _CATALOG_BATCH}
+        )
 
-    courses = []
-    for row in rows:
-        courses.append(
+        courses = tuple(
             {
                 "course_code": row.code,
                 "title": row.title,
@@ -711,54 +882,61 @@ def search_available_courses(
                 "enrolled_count": row.enrolled_count,
                 "available_spots": row.capacity - row.enrolled_count,
             }
+            for row in result
         )
-
-    return courses
+        _CATALOG_CACHE.set(cache_key, courses)
+        return [dict(course) for course in courses]
 
 
 # Helper functions for complex enrollment workflow
 
 
+def _conflict_items(
+    conflicts: list[dict], course_code: str
+) -> tuple[ConflictItem, ...]:
+    """Convert _check_time_conflicts results into EnrollmentResponse conflict items."""
+    return tuple(
+        ConflictItem(
+            type="time_conflict",
+            description=conf["description"],
+            course_code=course_code,
+            day=conf["day"],
+        )
+        for conf in conflicts
+    )
+
+
 def _check_time_conflicts(db, student_id: str, target_section_id: str) -> list[dict]:
     """Check for time conflicts between target section and student's current schedule."""
-    conflicts = []
+    return _conflicts_by_section(db, student_id, [target_section_id]).get(
+        target_section_id, []
+    )
 
-    # Get target section meeting times
-    target_meetings_query = """
-    SELECT day_of_week, time_range
-    FROM section_meeting
-    WHERE section_id = :section_id
-    """
-    target_meetings = db.execute(
-        text(target_meetings_query), {"section_id": target_section_id}
-    ).fetchall()
 
-    # Get student's current meeting times
-    current_meetings_query = """
-    SELECT sm.day_of_week, sm.time_range, c.code as course_code
-    FROM enrollment e
-    JOIN section s ON e.section_id = s.section_id
-    JOIN section_meeting sm ON s.section_id = sm.section_id
-    JOIN course c ON s.course_id = c.course_id
-    WHERE e.student_id = :student_id AND e.status = 'registered'
-    """
-    current_meetings = db.execute(
-        text(current_meetings_query), {"student_id": student_id}
-    ).fetchall()
+def _conflicts_by_section(db, student_id: str, section_ids: list) -> dict[Any, list]:
+    """Find time conflicts for several candidate sections in one query.
 
-    # Check for conflicts (simplified - same day overlap)
-    for target_meeting in target_meetings:
-        for current_meeting in current_meetings:
-            if target_meeting.day_of_week == current_meeting.day_of_week:
-                conflicts.append(
-                    {
-                        "description": f"Time conflict on {target_meeting.day_of_week} with {current_meeting.course_code}",
-                        "day": target_meeting.day_of_week,
-                        "conflicting_course": current_meeting.course_code,
-                    }
-                )
+    Returns conflict descriptions keyed by section_id; sections without
+    conflicts are absent from the result.
+    """
+    conflicts_by_section: dict[Any, list] = {}
+    if not section_ids:
+        return conflicts_by_section
 
-    return conflicts
+    rows = db.execute(
+        _SECTION_CONFLICTS_SQL,
+        {"section_ids": list(section_ids), "student_id": student_id},
+    ).fetchall()
+    for row in rows:
+        day = _DAY_NAMES[row.day_of_week]
+        conflicts_by_section.setdefault(row.section_id, []).append(
+            {
+                "description": f"Time conflict on {day} with {row.course_code}",
+                "day": day,
+                "conflicting_course": row.course_code,
+            }
+        )
+    return conflicts_by_section
 
 
 def _find_alternative_section(
@@ -771,28 +949,18 @@ def _find_alternative_section(
     """Find alternative sections for a course that have capacity and optionally no conflicts."""
 
     # Get all sections for the course except the requested one
-    sections_query = """
-    SELECT s.section_id, s.section_code, s.capacity,
-           COUNT(e.enrollment_id) as current_enrollment
-    FROM section s
-    JOIN course c ON s.course_id = c.course_id
-    LEFT JOIN enrollment e ON s.section_id = e.section_id AND e.status = 'registered'
-    WHERE c.code = :course_code AND s.section_code != :requested_section
-    GROUP BY s.section_id, s.section_code, s.capacity
-    HAVING COUNT(e.enrollment_id) < s.capacity
-    ORDER BY s.section_code
-    """
-
     alternative_sections = db.execute(
-        text(sections_query),
+        _ALTERNATIVE_SECTIONS_SQL,
         {"course_code": course_code, "requested_section": requested_section},
     ).fetchall()
 
-    # If we need to avoid conflicts, check each section
+    # If we need to avoid conflicts, check every candidate in one query
     if avoid_conflicts:
+        conflicting = _conflicts_by_section(
+            db, student_id, [section.section_id for section in alternative_sections]
+        )
         for section in alternative_sections:
-            conflicts = _check_time_conflicts(db, student_id, section.section_id)
-            if not conflicts:  # No conflicts found
+            if section.section_id not in conflicting:  # No conflicts found
                 return {
                     "section_id": section.section_id,
                     "section_code": section.section_code,
@@ -844,66 +1012,150 @@ def _enroll_in_alternative_section(
 
 def _complete_enrollment(db, student_id: str, section_id: str, course_section: str):
     """Complete the actual enrollment process."""
+    return _complete_enrollments(db, student_id, [(section_id, course_section)])
+
+
+def _complete_enrollments(db, student_id: str, sections: list[tuple[Any, str]]):
+    """Enroll a student in several sections with one INSERT and one commit.
+
+    ``sections`` holds (section_id, "COURSE SECTION") pairs, such as a
+    lecture and its lab. The response carries the first enrollment id.
+    """
+    rows = [
+        {
+            "enrollment_id": str(uuid.uuid4()),
+            "student_id": student_id,
+            "section_id": section_id,
+            "status": "registered",
+        }
+        for section_id, _ in sections
+    ]
     try:
-        enrollment_id = str(uuid.uuid4())
-        enrollment_query = """
-        INSERT INTO enrollment (enrollment_id, student_id, section_id, status)
-        VALUES (:enrollment_id, :student_id, :section_id, 'registered')
-        RETURNING enrollment_id
-        """
+        # A concurrent request may have enrolled the student since the
+        # attachability check; skip those rows instead of raising
+        inserted = db.execute(
+            insert(Enrollment)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=["student_id", "section_id"])
+            .returning(Enrollment.enrollment_id)
+        ).all()
+        if len(inserted) < len(rows):
+            db.rollback()
+            return EnrollmentResponse(
+                success=False,
+                message="Already enrolled in this course",
+                enrollment_id=None,
+                updated_schedule=_build_schedule(db, student_id),
+                conflicts=_NO_CONFLICTS,
+                transaction_id=_new_transaction_id(),
+            )
 
-        result = db.execute(
-            text(enrollment_query),
-            {
-                "enrollment_id": enrollment_id,
-                "student_id": student_id,
-                "section_id": section_id,
-            },
-        )
-        enrollment_id = str(result.fetchone().enrollment_id)
+        # Only the new entries go back to the agent, not the whole schedule
+        schedule_delta = _schedule_delta(db, [section_id for section_id, _ in sections])
         db.commit()
+        _forget_prerequisites(student_id)
+        _CATALOG_CACHE.clear()
 
-        updated_schedule = get_current_schedule.invoke({"student_id": student_id})
-
-        return EnrollmentResponse(
+        # Every field here is already typed (the delta is a validated
+        # ScheduleDelta), so skip re-validation on the success path
+        return EnrollmentResponse.model_construct(
             success=True,
-            message=f"Successfully enrolled in {course_section}",
-            enrollment_id=enrollment_id,
-            updated_schedule=updated_schedule,
-            conflicts=[],
-            transaction_id=str(uuid.uuid4()),
+            message=f"Successfully enrolled in {', '.join(label for _, label in sections)}",
+            enrollment_id=rows[0]["enrollment_id"],
+            updated_schedule=None,
+            schedule_delta=schedule_delta,
+            conflicts=_NO_CONFLICTS,
+            transaction_id=_new_transaction_id(),
         )
-    except Exception as e:
+    except SQLAlchemyError:
         db.rollback()
-        raise e
+        raise
 
 
-def _notify_department_head(db, student_id: str, course_code: str, reason: str):
-    """Notify department head about enrollment issues."""
-    # This could send an email, create a notification, or log to a system
-    # For now, we'll just log it
+def _schedule_delta(db, section_ids: list) -> ScheduleDelta:
+    """Build the schedule entries and credit change for newly enrolled sections."""
+    rows = db.execute(
+        _SECTION_ENTRIES_SQL, {"section_ids": list(section_ids)}
+    ).fetchall()
+    meetings = _meetings_for_sections(db, [row.section_id for row in rows])
+    return ScheduleDelta(
+        added=[
+            ScheduleItem(
+                course_code=row.course_code,
+                course_title=row.course_title,
+                section_code=row.section_code,
+                credits=row.credits,
+                instructor=row.instructor,
+                status="enrolled",
+                meetings=meetings[str(row.section_id)],
+            )
+            for row in rows
+        ],
+        total_credits_delta=sum(row.credits for row in rows),
+    )
 
-    # Get course department
-    dept_query = """
-    SELECT d.name as department_name
-    FROM course c
-    JOIN department d ON c.department_id = d.department_id
-    WHERE c.code = :course_code
-    """
 
-    try:
-        result = db.execute(text(dept_query), {"course_code": course_code})
-        dept = result.fetchone()
-        dept_name = dept.department_name if dept else "Unknown Department"
+def _should_notify(key: tuple[str, str, str]) -> bool:
+    """Return False if the same notification was sent within the dedup window."""
+    now = time.monotonic()
+    with _NOTIFY_SEEN_LOCK:
+        sent_at = _NOTIFY_SEEN.get(key)
+        if sent_at is not None and now - sent_at < _NOTIFY_DEDUP_SECONDS:
+            return False
+        if len(_NOTIFY_SEEN) >= _NOTIFY_SEEN_MAX:
+            _NOTIFY_SEEN.clear()
+        _NOTIFY_SEEN[key] = now
+    return True
 
-        logging.info(
-            f"DEPARTMENT NOTIFICATION: {dept_name} - Student {student_id} cannot enroll in {course_code}. Reason: {reason}"
+
+def _notify_department_head_detached(
+    student_id: str, course_code: str, reason: str, *, department_id=None
+):
+    """Send a department notification from a worker thread.
+
+    The submitting tool drops the future, so failures are logged here
+    rather than lost inside the executor.
+    """
+    try:
+        _notify_department_head(
+            student_id, course_code, reason, department_id=department_id
         )
+    except Exception:
+        logger.exception(
+            "Failed to notify department head for %s (%s)", course_code, reason
+        )
+
 
-        # TODO: Implement actual notification system
-        # - Send email to department head
-        # - Create database notification record
-        # - Add to pending requests queue
+def _notify_department_head(
+    student_id: str, course_code: str, reason: str, *, department_id=None
+):
+    """Notify department head about enrollment issues.
 
-    except Exception as e:
-        logging.error(f"Failed to notify department head: {str(e)}")
+    Callers pass the course's department_id from the row they already
+    selected; there is no department table to resolve a name from.
+    """
+    if not _should_notify((str(student_id), course_code, reason)):
+        return
+
+    logger.info(
+        "DEPARTMENT NOTIFICATION: department %s - Student %s cannot enroll in %s. Reason: %s",
+        department_id,
+        student_id,
+        course_code,
+        reason,
+        extra={
+            "event": "department_notification",
+            "department_id": str(department_id) if department_id else None,
+            "student_id": student_id,
+            "course_code": course_code,
+            "reason": reason,
+        },
+    )
+
+    # Persisted in batches; email delivery is still to come
+    notification_batcher.add(
+        student_id=student_id,
+        course_code=course_code,
+        department_id=department_id,
+        reason=reason,
+    )
@@ -180,8 +180,11 @@ async def send_chat_message(
             for msg in conversation_history:
                 history.append({"role": msg.role, "content": msg.content})
 
-            # Process with LangGraph student agent
-            agent_response = process_student_request(
+            # Process with LangGraph student agent. The agent turn makes
+            # blocking LLM and database calls, so run it on a worker thread
+            # instead of stalling the event loop for every other request.
+            agent_response = await asyncio.to_thread(
+                process_student_request,
                 message=request.message,
                 student_id=current_user.actor_id,
                 conversation_history=history,
@@ -216,16 +219,16 @@ async def send_chat_message(
         logger.info(f"✅ Agent response: '{reply.message[:100]}...'")
 
         # Save assistant response
-        # Convert audit data to JSON-serializable format
-        audit_dict = reply.audit.model_dump()
-        # Manually convert datetime to ISO format string
-        if "timestamp" in audit_dict and isinstance(audit_dict["timestamp"], datetime):
-            audit_dict["timestamp"] = audit_dict["timestamp"].isoformat()
-
-        # Convert cards and actions to JSON-serializable format
-        cards_json = [card.model_dump() for card in reply.cards] if reply.cards else []
+        # Pydantic's JSON mode emits JSON-safe values (ISO timestamps, enum
+        # values) in one serializer pass, so nothing needs post-processing
+        audit_dict = reply.audit.model_dump(mode="json")
+        cards_json = (
+            [card.model_dump(mode="json") for card in reply.cards] if reply.cards else []
+        )
         actions_json = (
-            [action.model_dump() for action in reply.actions] if reply.actions else []
+            [action.model_dump(mode="json") for action in reply.actions]
+            if reply.actions
+            else []
         )
 
         assistant_message = ChatMessage(
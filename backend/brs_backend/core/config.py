@@ -13,6 +13,9 @@ class Settings:
         self.ENABLE_DETAILED_LOGGING = (
             os.getenv("ENABLE_DETAILED_LOGGING", "false").lower() == "true"
         )
+        # Records buffered before a bulk write, and max seconds between flushes
+        self.LOG_BUFFER_CAPACITY = int(os.getenv("LOG_BUFFER_CAPACITY", "512"))
+        self.LOG_FLUSH_INTERVAL = float(os.getenv("LOG_FLUSH_INTERVAL", "1.0"))
 
         # AI service configuration
         self.OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
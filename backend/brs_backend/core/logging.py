@@ -1,16 +1,55 @@
 """Logging configuration for the BRS backend."""
 
+import atexit
 import logging
+import threading
+from logging.handlers import MemoryHandler
+
 from brs_backend.core.config import settings
 
 
+def _start_periodic_flush(handler: MemoryHandler, interval: float) -> threading.Thread:
+    """Flush buffered records on a fixed interval so INFO lines stay timely.
+
+    The loop stops at interpreter exit; logging's own shutdown hook, which
+    runs after this one, then flushes and closes the handler.
+    """
+    stop = threading.Event()
+    atexit.register(stop.set)
+
+    def _flush_loop():
+        while not stop.wait(interval):
+            handler.flush()
+
+    thread = threading.Thread(target=_flush_loop, name="brs-log-flush", daemon=True)
+    thread.start()
+    return thread
+
+
 def setup_logging():
-    """Configure logging based on environment settings."""
+    """Configure logging based on environment settings.
+
+    Records are buffered in a MemoryHandler and written to the stream in
+    bulk; ERROR records (and a full buffer) flush immediately, and a
+    background thread flushes whatever is pending every
+    LOG_FLUSH_INTERVAL seconds.
+    """
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    memory_handler = MemoryHandler(
+        capacity=settings.LOG_BUFFER_CAPACITY,
+        flushLevel=logging.ERROR,
+        target=stream_handler,
+        flushOnClose=True,
+    )
+
     logging.basicConfig(
         level=getattr(logging, settings.LOG_LEVEL, logging.INFO),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler()],
+        handlers=[memory_handler],
     )
+    _start_periodic_flush(memory_handler, settings.LOG_FLUSH_INTERVAL)
 
     logger = logging.getLogger(__name__)
     logger.info(
@@ -1,5 +1,9 @@
 """Database configuration and session management for the BRS prototype."""
 
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
@@ -11,12 +15,106 @@ engine = create_engine(settings.DATABASE_URL, echo=settings.DEBUG)
 # Create a configured "Session" class
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
+# Read-only tools run on autocommit connections: no BEGIN/ROLLBACK per call
+# and, for Core reads, no Session bookkeeping
+_ro_engine = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+# Sessions for read-only tools that need ORM loading (eager-loaded listings)
+ReadOnlySessionLocal = sessionmaker(bind=_ro_engine, autoflush=False)
+
 # Base class for declarative models
 Base = declarative_base()
 
 
+def ro_conn():
+    """Open an autocommit Core connection for a read-only tool."""
+    return _ro_engine.connect()
+
+
+# Sessions shared by the tool calls of one agent turn, keyed by thread id.
+# Sessions are not thread-safe, so tools running on different worker threads
+# each get their own.
+_session_ctx: ContextVar[dict | None] = ContextVar("tool_sessions", default=None)
+
+
+@contextmanager
+def tool_session():
+    """Share one session per thread across the tool calls in the block.
+
+    Only the Session object is shared: each tool ends its transaction when it
+    releases the session, so no connection sits idle in a transaction while
+    the agent waits on the LLM. Nested blocks reuse the outermost scope; the
+    sessions are closed when the outermost block exits.
+    """
+    if _session_ctx.get() is not None:
+        yield
+        return
+
+    sessions: dict = {}
+    token = _session_ctx.set(sessions)
+    try:
+        yield
+    finally:
+        _session_ctx.reset(token)
+        for db in sessions.values():
+            db.close()
+
+
+def shared_session():
+    """Return this thread's session in the enclosing tool_session(), or None.
+
+    Tools call ``shared_session() or SessionLocal()`` and hand the result to
+    release_session() when done.
+    """
+    sessions = _session_ctx.get()
+    if sessions is None:
+        return None
+    thread_id = threading.get_ident()
+    db = sessions.get(thread_id)
+    if db is None:
+        db = sessions[thread_id] = SessionLocal()
+    elif not db.is_active:
+        # An earlier tool failed without rolling back; start clean
+        db.rollback()
+    return db
+
+
+def release_session(db):
+    """End a tool's use of its session.
+
+    A session owned by the enclosing tool_session() is rolled back, which
+    ends its transaction and returns the connection to the pool; any other
+    session is closed.
+    """
+    sessions = _session_ctx.get()
+    if sessions is not None and sessions.get(threading.get_ident()) is db:
+        db.rollback()
+        return
+    db.close()
+
+
+@contextmanager
+def tool_db():
+    """Provide a session for one tool call, released when the block exits."""
+    db = shared_session() or SessionLocal()
+    try:
+        yield db
+    finally:
+        release_session(db)
+
+
 def get_db():
     """Provide a database session for request handlers."""
+    db = shared_session()
+    if db is not None:
+        # Owned by the enclosing tool_session(), which closes it; only the
+        # transaction ends here
+        try:
+            yield db
+        finally:
+            db.rollback()
+        return
+
     db = SessionLocal()
     try:
         yield db
@@ -14,6 +14,8 @@ from sqlalchemy import (
     UniqueConstraint,
     BIGINT,
     Index,
+    DDL,
+    event,
 )
 from sqlalchemy.dialects.postgresql import UUID, TSRANGE, JSONB
 from sqlalchemy.orm import relationship
@@ -175,6 +177,20 @@ class Course(Base):
         CheckConstraint(course_type.in_(["major", "university", "elective"])),
         CheckConstraint(semester_pattern.in_(["odd", "even", "both"])),
         CheckConstraint(delivery_mode.in_(["in_person", "online", "hybrid"])),
+        Index("course_code_idx", "code"),  # Lookups by course code
+        # Substring (ILIKE '%...%') catalog search on code and title
+        Index(
+            "course_code_trgm_idx",
+            "code",
+            postgresql_using="gin",
+            postgresql_ops={"code": "gin_trgm_ops"},
+        ),
+        Index(
+            "course_title_trgm_idx",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
     )
 
     # Relationships
@@ -190,6 +206,14 @@ class Course(Base):
     )
 
 
+# The trigram indexes need the pg_trgm operator classes
+event.listen(
+    Course.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"),
+)
+
+
 class CoursePrereq(Base):
     __tablename__ = "course_prereq"
 
@@ -305,14 +329,16 @@ class SectionMeeting(Base):
     __table_args__ = (
         CheckConstraint(activity.in_(["LEC", "LAB", "TUT"])),
         CheckConstraint("day_of_week BETWEEN 0 AND 6"),
-        Index("section_meeting_section_id_idx", "section_id"),
+        # Meetings by section, optionally narrowed to a day
+        Index("section_meeting_section_day_idx", "section_id", "day_of_week"),
         Index(
             "section_meeting_day_idx", "day_of_week"
         ),  # Regular B-tree index for day_of_week
         Index(
             "section_meeting_tr_gist",
+            "day_of_week",
             "time_range",
-            postgresql_using="gist",  # GiST index only for time_range
+            postgresql_using="gist",  # Same-day overlap (&&) lookups
         ),
     )
 
@@ -322,6 +348,14 @@ class SectionMeeting(Base):
     calendar_bindings = relationship("CalendarBinding", back_populates="meeting")
 
 
+# GiST on the integer day_of_week column needs the btree_gist operator classes
+event.listen(
+    SectionMeeting.__table__,
+    "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS btree_gist"),
+)
+
+
 class Enrollment(Base):
     __tablename__ = "enrollment"
 
@@ -329,11 +363,14 @@ class Enrollment(Base):
     student_id = Column(UUID(as_uuid=True), ForeignKey("student.student_id"))
     section_id = Column(UUID(as_uuid=True), ForeignKey("section.section_id"))
     status = Column(Text, nullable=False)
-    enrolled_at = Column(TIMESTAMP, default=func.now())
+    enrolled_at = Column(TIMESTAMP, server_default=func.now())
 
     __table_args__ = (
         CheckConstraint(status.in_(["registered", "waitlisted", "dropped"])),
         UniqueConstraint("student_id", "section_id"),
+        # A student's registered sections, and a section's registered count
+        Index("enrollment_student_status_idx", "student_id", "status"),
+        Index("enrollment_section_status_idx", "section_id", "status"),
     )
 
     # Relationships
@@ -351,7 +388,7 @@ class RegistrationRequest(Base):
     to_section_id = Column(UUID(as_uuid=True), ForeignKey("section.section_id"))
     reason = Column(Text)
     state = Column(Text, nullable=False)
-    created_at = Column(TIMESTAMP, default=func.now())
+    created_at = Column(TIMESTAMP, server_default=func.now())
 
     __table_args__ = (
         CheckConstraint(type.in_(["ADD", "DROP", "CHANGE_SECTION"])),
@@ -367,6 +404,21 @@ class RegistrationRequest(Base):
                 ]
             )
         ),
+        # A student's requests of a given type and state
+        Index(
+            "registration_request_student_type_state_idx",
+            "student_id",
+            "type",
+            "state",
+        ),
+        # A student's most recent requests (advisor profile)
+        Index(
+            "registration_request_student_created_idx",
+            "student_id",
+            created_at.desc(),
+        ),
+        # Advisor and department review queues filter on state alone
+        Index("registration_request_state_idx", "state"),
     )
 
     # Relationships
@@ -396,7 +448,7 @@ class RequestDecision(Base):
     actor_role = Column(Text)
     action = Column(Text)
     rationale = Column(Text)
-    decided_at = Column(TIMESTAMP, default=func.now())
+    decided_at = Column(TIMESTAMP, server_default=func.now())
 
     __table_args__ = (
         CheckConstraint(actor_role.in_(["advisor", "department_head"])),
@@ -422,6 +474,19 @@ class RequestConflict(Base):
     request = relationship("RegistrationRequest", back_populates="conflicts")
 
 
+class DepartmentNotification(Base):
+    """Enrollment problem reported to a course's department head."""
+
+    __tablename__ = "department_notification"
+
+    id = Column(BIGINT, primary_key=True, autoincrement=True)  # BIGSERIAL
+    student_id = Column(UUID(as_uuid=True), nullable=False)
+    course_code = Column(Text, nullable=False)
+    department_id = Column(UUID(as_uuid=True))
+    reason = Column(Text, nullable=False)
+    created_at = Column(TIMESTAMP, server_default=func.now())
+
+
 class CalendarEvent(Base):
     __tablename__ = "calendar_event"
 
@@ -479,7 +544,7 @@ class StudentSignal(Base):
     student_id = Column(UUID(as_uuid=True), ForeignKey("student.student_id"))
     signal_type = Column(Text)
     signal_value = Column(JSONB)
-    created_at = Column(TIMESTAMP, default=func.now())
+    created_at = Column(TIMESTAMP, server_default=func.now())
 
     # Relationships
     student = relationship("Student", back_populates="signals")
@@ -494,7 +559,7 @@ class Recommendation(Base):
     proposal = Column(JSONB)
     features = Column(JSONB)
     score = Column(DECIMAL)  # DOUBLE PRECISION
-    created_at = Column(TIMESTAMP, default=func.now())
+    created_at = Column(TIMESTAMP, server_default=func.now())
 
     __table_args__ = (
         CheckConstraint(kind.in_(["add_course", "swap_section", "cancel_course"])),
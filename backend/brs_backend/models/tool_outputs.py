@@ -1,6 +1,6 @@
 """Pydantic models for structured tool outputs - LangGraph migration."""
 
-from datetime import datetime, time, date
+from datetime import datetime, time, date, timezone
 from typing import Any, Union, Literal
 
 try:
@@ -126,6 +126,13 @@ class StudentSchedule(BaseModel):
     schedule: list[ScheduleItem]
 
 
+class ScheduleDelta(BaseModel):
+    """Schedule change from a successful enrollment, sent instead of the full schedule."""
+
+    added: list[ScheduleItem]
+    total_credits_delta: int
+
+
 # Conflict and Violation Models
 class Violation(BaseModel):
     """Business rule violation."""
@@ -205,7 +212,8 @@ class EnrollmentResponse(BaseToolResponse):
     message: str = Field(description="Human-readable result message")
     enrollment_id: str | None = None
     updated_schedule: StudentSchedule | None = None
-    conflicts: list[ConflictItem] = Field(default_factory=list)
+    schedule_delta: ScheduleDelta | None = None
+    conflicts: tuple[ConflictItem, ...] = ()
     transaction_id: str = Field(description="Unique transaction identifier")
 
     # Legacy fields for backward compatibility
@@ -254,7 +262,9 @@ class CalendarSyncResponse(BaseToolResponse):
     calendar_data: str | None = None  # iCal format string
     events_count: int = 0
     format: str = "ical"
-    sync_timestamp: datetime = Field(default_factory=datetime.utcnow)
+    sync_timestamp: datetime = Field(
+        default_factory=lambda: datetime.now(timezone.utc)
+    )
 
 
 # LangGraph State Models
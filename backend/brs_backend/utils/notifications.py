@@ -0,0 +1,83 @@
+"""Batched persistence for department-head notifications."""
+
+import atexit
+import logging
+import threading
+
+from sqlalchemy import insert
+
+from brs_backend.database.connection import SessionLocal
+from brs_backend.models.database import DepartmentNotification
+
+logger = logging.getLogger(__name__)
+
+
+class NotificationBatcher:
+    """Queue notification rows in memory and write them with multi-row INSERTs.
+
+    Pending rows are flushed when ``max_batch`` rows have accumulated, every
+    ``flush_interval`` seconds from a background thread, and at interpreter
+    exit. Each flush is a single ``INSERT ... VALUES (...), (...)`` and one
+    commit, no matter how many rows it carries.
+    """
+
+    def __init__(self, max_batch: int = 256, flush_interval: float = 1.0):
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._pending: list[dict] = []
+        self._lock = threading.Lock()
+        self._started = False
+        self._stop = threading.Event()
+
+    def add(self, **row) -> None:
+        """Queue one notification row, flushing if the batch is full."""
+        with self._lock:
+            self._pending.append(row)
+            batch_full = len(self._pending) >= self.max_batch
+            if not self._started:
+                self._start()
+        if batch_full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write all pending rows; returns the number of rows persisted."""
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if not batch:
+            return 0
+
+        db = SessionLocal()
+        try:
+            db.execute(insert(DepartmentNotification).values(batch))
+            db.commit()
+            return len(batch)
+        except Exception as e:
+            db.rollback()
+            logger.error(
+                "Failed to persist %d department notifications: %s", len(batch), e
+            )
+            return 0
+        finally:
+            db.close()
+
+    def _start(self) -> None:
+        """Start the periodic flusher and register the exit flush (lock held)."""
+        self._started = True
+        atexit.register(self._shutdown)
+        thread = threading.Thread(
+            target=self._flush_loop, name="brs-notify-flush", daemon=True
+        )
+        thread.start()
+
+    def _flush_loop(self) -> None:
+        while not self._stop.wait(self.flush_interval):
+            self.flush()
+
+    def _shutdown(self) -> None:
+        """Stop the periodic flusher, then write what is still pending."""
+        self._stop.set()
+        self.flush()
+
+
+# Shared batcher used by the enrollment tools
+notification_batcher = NotificationBatcher()
@@ -46,10 +46,10 @@ def test_get_pending_requests_basic():
     advisor_id = str(uuid.uuid4())
     
     # Test with proper invoke method
-    with patch('brs_backend.agents.advisor_tools.SessionLocal') as mock_session:
+    with patch('brs_backend.agents.advisor_tools.ReadOnlySessionLocal') as mock_session:
         mock_db = Mock()
         mock_session.return_value = mock_db
-        mock_db.query.return_value.join.return_value.filter.return_value.all.return_value = []
+        mock_db.query.return_value.join.return_value.options.return_value.filter.return_value.all.return_value = []
         
         result = get_pending_requests.invoke({"advisor_id": advisor_id})
         
@@ -59,6 +59,25 @@ def test_get_pending_requests_basic():
         mock_db.close.assert_called_once()
 
 
+def test_count_pending_requests_basic():
+    """Test the count-only pending requests tool."""
+    from brs_backend.agents.advisor_tools import count_pending_requests
+
+    advisor_id = str(uuid.uuid4())
+
+    with patch('brs_backend.agents.advisor_tools.ro_conn') as mock_conn:
+        mock_db = Mock()
+        mock_conn.return_value = mock_db
+        mock_db.execute.return_value.scalar_one.return_value = 3
+
+        result = count_pending_requests.invoke({"advisor_id": advisor_id})
+
+        assert result.success is True
+        assert result.total_count == 3
+        mock_db.query.assert_not_called()
+        mock_db.close.assert_called_once()
+
+
 def test_get_advisees_basic():
     """Test basic get advisees functionality."""
     from brs_backend.agents.advisor_tools import get_advisees
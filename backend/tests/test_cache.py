@@ -0,0 +1,52 @@
+"""Tests for the in-process TTL cache."""
+
+from unittest.mock import patch
+
+
+def test_ttl_cache_expires_entries():
+    """Entries are served until their TTL elapses."""
+    from brs_backend.utils.cache import TTLCache
+
+    cache = TTLCache(maxsize=10, ttl=60.0)
+
+    with patch("brs_backend.utils.cache.time.monotonic", return_value=100.0):
+        cache.set("student-1", {"CS201": None})
+        assert cache.get("student-1") == {"CS201": None}
+
+    with patch("brs_backend.utils.cache.time.monotonic", return_value=159.0):
+        assert cache.get("student-1") == {"CS201": None}
+
+    with patch("brs_backend.utils.cache.time.monotonic", return_value=160.0):
+        assert cache.get("student-1") is None
+        assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_oldest_when_full():
+    """A full cache drops its oldest entry to make room."""
+    from brs_backend.utils.cache import TTLCache
+
+    cache = TTLCache(maxsize=2, ttl=60.0)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+    assert cache.pop("b") == 2
+    assert cache.get("b") is None
+
+
+def test_ttl_cache_pop_where_removes_matching_keys():
+    """pop_where drops only the entries whose keys match."""
+    from brs_backend.utils.cache import TTLCache
+
+    cache = TTLCache(maxsize=10, ttl=60.0)
+    cache.set(("student-1", "CS201"), None)
+    cache.set(("student-1", "CS301"), ("CS201", True))
+    cache.set(("student-2", "CS201"), None)
+
+    cache.pop_where(lambda key: key[0] == "student-1")
+
+    assert len(cache) == 1
+    assert cache.get(("student-2", "CS201"), "missing") is None
@@ -0,0 +1,57 @@
+"""Tests for session scoping in the database connection module."""
+
+from unittest.mock import MagicMock, patch
+
+
+def test_tool_session_shares_one_session_per_thread():
+    """get_db() reuses the scoped session and closes it when the scope ends."""
+    from brs_backend.database.connection import get_db, tool_session
+
+    with patch(
+        "brs_backend.database.connection.SessionLocal",
+        side_effect=lambda: MagicMock(is_active=True),
+    ) as session_factory:
+        with tool_session():
+            first = next(get_db())
+            with tool_session():
+                second = next(get_db())
+            first.close.assert_not_called()
+
+        assert first is second
+        assert session_factory.call_count == 1
+        first.close.assert_called_once()
+
+        unscoped = get_db()
+        db = next(unscoped)
+        assert db is not first
+        unscoped.close()
+        db.close.assert_called_once()
+
+
+def test_release_session_leaves_scoped_session_open():
+    """Tools using shared_session() only close sessions they created."""
+    from brs_backend.database.connection import (
+        release_session,
+        shared_session,
+        tool_session,
+    )
+
+    with patch(
+        "brs_backend.database.connection.SessionLocal",
+        side_effect=lambda: MagicMock(is_active=True),
+    ):
+        assert shared_session() is None
+
+        with tool_session():
+            db = shared_session()
+            release_session(db)
+            # The transaction ends but the scoped session stays open
+            db.rollback.assert_called_once()
+            db.close.assert_not_called()
+            assert shared_session() is db
+
+        db.close.assert_called_once()
+
+        own = MagicMock()
+        release_session(own)
+        own.close.assert_called_once()
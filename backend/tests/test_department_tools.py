@@ -35,7 +35,7 @@ def test_get_department_requests_basic():
     with patch('brs_backend.agents.department_tools.SessionLocal') as mock_session:
         mock_db = Mock()
         mock_session.return_value = mock_db
-        mock_db.query.return_value.join.return_value.filter.return_value.all.return_value = []
+        mock_db.query.return_value.join.return_value.options.return_value.filter.return_value.all.return_value = []
         
         result = get_department_requests.invoke({"department_id": department_id})
         
@@ -0,0 +1,70 @@
+"""Tests for batched department notification persistence."""
+
+from unittest.mock import Mock, patch
+
+
+def test_notification_batcher_flushes_single_insert():
+    """Pending notifications are written with one statement and one commit."""
+    from brs_backend.utils.notifications import NotificationBatcher
+
+    batcher = NotificationBatcher(max_batch=10)
+    batcher._started = True  # Don't start the background flusher in tests
+
+    with patch("brs_backend.utils.notifications.SessionLocal") as mock_session:
+        mock_db = Mock()
+        mock_session.return_value = mock_db
+
+        for i in range(3):
+            batcher.add(
+                student_id=f"student-{i}",
+                course_code="CS101",
+                department_id="dept-1",
+                reason="ALL_SECTIONS_FULL",
+            )
+
+        assert batcher.flush() == 3
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+        mock_db.close.assert_called_once()
+
+        # Nothing pending: no new session is opened
+        assert batcher.flush() == 0
+        assert mock_session.call_count == 1
+
+
+def test_notification_batcher_flushes_when_full():
+    """Reaching max_batch triggers an immediate flush."""
+    from brs_backend.utils.notifications import NotificationBatcher
+
+    batcher = NotificationBatcher(max_batch=2)
+    batcher._started = True
+
+    with patch("brs_backend.utils.notifications.SessionLocal") as mock_session:
+        mock_db = Mock()
+        mock_session.return_value = mock_db
+
+        batcher.add(student_id="s1", course_code="CS101", reason="SCHEDULE_CONFLICTS")
+        mock_db.execute.assert_not_called()
+
+        batcher.add(student_id="s2", course_code="CS101", reason="SCHEDULE_CONFLICTS")
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
+
+
+def test_notification_batcher_shutdown_stops_flusher():
+    """The exit hook stops the periodic flusher before the final flush."""
+    from brs_backend.utils.notifications import NotificationBatcher
+
+    batcher = NotificationBatcher(max_batch=10)
+    batcher._started = True
+
+    with patch("brs_backend.utils.notifications.SessionLocal") as mock_session:
+        mock_db = Mock()
+        mock_session.return_value = mock_db
+
+        batcher.add(student_id="s1", course_code="CS101", reason="ALL_SECTIONS_FULL")
+        batcher._shutdown()
+
+        assert batcher._stop.is_set()
+        mock_db.execute.assert_called_once()
+        mock_db.commit.assert_called_once()
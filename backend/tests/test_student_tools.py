@@ -132,14 +132,229 @@ def test_get_pending_requests_basic():
     advisor_id = str(uuid.uuid4())
     
     # Test with proper invoke method
-    with patch('brs_backend.agents.advisor_tools.SessionLocal') as mock_session:
+    with patch('brs_backend.agents.advisor_tools.ReadOnlySessionLocal') as mock_session:
         mock_db = Mock()
         mock_session.return_value = mock_db
-        mock_db.query.return_value.join.return_value.filter.return_value.all.return_value = []
+        mock_db.query.return_value.join.return_value.options.return_value.filter.return_value.all.return_value = []
         
         result = get_pending_requests.invoke({"advisor_id": advisor_id})
         
         # Verify result structure
         assert hasattr(result, 'success')
         assert hasattr(result, 'requests')
-        mock_db.close.assert_called_once()
\ No newline at end of file
+        mock_db.close.assert_called_once()
+
+
+def test_section_meetings_are_cached():
+    """Meetings are read once per section and then served from the cache."""
+    from brs_backend.agents.student_tools import (
+        _MEETINGS_CACHE,
+        _meetings_for_sections,
+    )
+
+    section_id = str(uuid.uuid4())
+    meeting_row = Mock(
+        section_id=section_id,
+        day_of_week=0,
+        start_time="09:00:00",
+        end_time="10:30:00",
+        room_name=None,
+    )
+    mock_db = Mock()
+    mock_db.execute.return_value = [meeting_row]
+
+    try:
+        first = _meetings_for_sections(mock_db, [section_id])
+        second = _meetings_for_sections(mock_db, [section_id])
+    finally:
+        _MEETINGS_CACHE.pop(section_id)
+
+    assert first == second == {
+        section_id: [
+            {"day": "Monday", "start_time": "09:00:00", "end_time": "10:30:00", "room": "TBD"}
+        ]
+    }
+    mock_db.execute.assert_called_once()
+
+
+def test_search_available_courses_is_cached():
+    """Repeated catalog searches are served without another query."""
+    from brs_backend.agents.student_tools import (
+        _CATALOG_CACHE,
+        search_available_courses,
+    )
+
+    row = Mock(
+        code="CS101",
+        title="Intro to Programming",
+        credits=3,
+        level=100,
+        course_type="major",
+        semester_pattern="both",
+        delivery_mode="in_person",
+        section_code="A1",
+        instructor_name="Dr. Smith",
+        capacity=30,
+        enrolled_count=10,
+    )
+    mock_db = Mock()
+    mock_db.execute.return_value = [row]
+
+    _CATALOG_CACHE.clear()
+    try:
+        with patch(
+            "brs_backend.database.connection.SessionLocal", return_value=mock_db
+        ):
+            first = search_available_courses.invoke({"query": "CS1"})
+            second = search_available_courses.invoke({"query": "CS1"})
+    finally:
+        _CATALOG_CACHE.clear()
+
+    assert first == second
+    assert first[0]["available_spots"] == 20
+    mock_db.execute.assert_called_once()
+
+    # Callers get copies, so mutating a result leaves the cache intact
+    first[0]["available_spots"] = 0
+    assert second[0]["available_spots"] == 20
+
+
+def test_detached_notification_logs_failures():
+    """Errors inside the notification worker are logged, not swallowed."""
+    from brs_backend.agents import student_tools
+
+    with patch.object(
+        student_tools,
+        "_notify_department_head",
+        side_effect=RuntimeError("batcher down"),
+    ), patch.object(student_tools.logger, "exception") as log_exception:
+        student_tools._notify_department_head_detached(
+            "student-1", "CS101", "ALL_SECTIONS_FULL", department_id=None
+        )
+
+    log_exception.assert_called_once()
+
+
+def test_section_updates_clear_catalog_cache():
+    """Section updates such as capacity overrides invalidate catalog searches."""
+    from brs_backend.agents.student_tools import _CATALOG_CACHE, _invalidate_catalog
+
+    _CATALOG_CACHE.set(("CS1", None, None), ({"course_code": "CS101"},))
+    _invalidate_catalog(None, None, Mock())
+
+    assert _CATALOG_CACHE.get(("CS1", None, None)) is None
+
+
+def test_complete_enrollments_rolls_back_on_conflict():
+    """A row skipped by ON CONFLICT rolls back and reports the enrollment."""
+    from sqlalchemy.dialects import postgresql
+
+    from brs_backend.agents.student_tools import _complete_enrollments
+
+    mock_db = Mock()
+    mock_db.execute.side_effect = [
+        Mock(all=Mock(return_value=[])),  # INSERT ... RETURNING skipped the row
+        Mock(fetchall=Mock(return_value=[])),  # Full schedule for the failure
+    ]
+
+    result = _complete_enrollments(
+        mock_db, "student-1", [(str(uuid.uuid4()), "CS101 A1")]
+    )
+
+    assert result.success is False
+    assert result.message == "Already enrolled in this course"
+    assert result.enrollment_id is None
+    assert result.updated_schedule.schedule == []
+    assert result.updated_schedule.course_count == 0
+    assert result.schedule_delta is None
+    mock_db.rollback.assert_called_once()
+    mock_db.commit.assert_not_called()
+
+    insert_stmt = mock_db.execute.call_args_list[0].args[0]
+    compiled = str(insert_stmt.compile(dialect=postgresql.dialect()))
+    assert "ON CONFLICT (student_id, section_id) DO NOTHING" in compiled
+
+
+def test_section_conflicts_require_overlapping_meetings():
+    """Only same-day meetings whose time ranges overlap count as conflicts."""
+    from brs_backend.agents.student_tools import (
+        _SECTION_CONFLICTS_SQL,
+        _conflicts_by_section,
+    )
+
+    sql = " ".join(str(_SECTION_CONFLICTS_SQL).split())
+    assert "cm.day_of_week = tm.day_of_week AND cm.time_range && tm.time_range" in sql
+
+    section_id = str(uuid.uuid4())
+    mock_db = Mock()
+    mock_db.execute.return_value.fetchall.return_value = [
+        Mock(section_id=section_id, day_of_week=0, course_code="MATH101")
+    ]
+
+    conflicts = _conflicts_by_section(mock_db, "student-1", [section_id])
+
+    assert conflicts == {
+        section_id: [
+            {
+                "description": "Time conflict on Monday with MATH101",
+                "day": "Monday",
+                "conflicting_course": "MATH101",
+            }
+        ]
+    }
+    mock_db.execute.assert_called_once()
+    assert _conflicts_by_section(mock_db, "student-1", []) == {}
+    mock_db.execute.assert_called_once()
+
+
+def test_build_schedule_summary_only_runs_totals_query():
+    """summary_only returns totals from one aggregate query and no items."""
+    from brs_backend.agents.student_tools import (
+        _SCHEDULE_TOTALS_SQL,
+        _build_schedule,
+    )
+
+    mock_db = Mock()
+    mock_db.execute.return_value.one.return_value = Mock(
+        total_credits=7, course_count=2
+    )
+
+    schedule = _build_schedule(mock_db, "student-1", summary_only=True)
+
+    assert schedule.schedule == []
+    assert schedule.total_credits == 7
+    assert schedule.course_count == 2
+    mock_db.execute.assert_called_once()
+    assert mock_db.execute.call_args.args[0] is _SCHEDULE_TOTALS_SQL
+
+
+def test_complete_enrollments_returns_schedule_delta():
+    """A successful enrollment returns only the new entries and credit change."""
+    from brs_backend.agents.student_tools import _MEETINGS_CACHE, _complete_enrollments
+
+    section_id = str(uuid.uuid4())
+    entry = Mock(
+        section_id=section_id,
+        course_code="CS101",
+        course_title="Intro to Programming",
+        section_code="A1",
+        credits=3,
+        instructor="Dr. Smith",
+    )
+    mock_db = Mock()
+    mock_db.execute.side_effect = [
+        Mock(all=Mock(return_value=[Mock()])),  # INSERT ... RETURNING
+        Mock(fetchall=Mock(return_value=[entry])),  # New schedule entries
+        [],  # No meetings for the section
+    ]
+
+    try:
+        result = _complete_enrollments(mock_db, "student-1", [(section_id, "CS101 A1")])
+    finally:
+        _MEETINGS_CACHE.pop(section_id)
+
+    assert result.success is True
+    assert result.updated_schedule is None
+    assert result.schedule_delta.total_credits_delta == 3
+    assert [item.course_code for item in result.schedule_delta.added] == ["CS101"]
+    mock_db.commit.assert_called_once()
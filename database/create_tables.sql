@@ -10,6 +10,13 @@
 -- affiliation.  Indexes are provided to support efficient time
 -- conflict checks.
 
+-- GiST operator classes for scalar columns (day_of_week in the meeting
+-- overlap index)
+CREATE EXTENSION IF NOT EXISTS btree_gist;
+
+-- Trigram operator classes for substring search on course code and title
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
 -- --------------------------------------------------------------------
 -- Campus and program metadata
 -- --------------------------------------------------------------------
@@ -81,6 +88,11 @@ CREATE TABLE course (
     campus_id       UUID REFERENCES campus(campus_id)
 );
 
+-- Tools look courses up by code (enrollment, prerequisites, notifications)
+CREATE INDEX course_code_idx ON course (code);
+CREATE INDEX course_code_trgm_idx ON course USING GIN (code gin_trgm_ops);
+CREATE INDEX course_title_trgm_idx ON course USING GIN (title gin_trgm_ops);
+
 -- Relationship table for prerequisites and corequisites
 CREATE TABLE course_prereq (
     course_id    UUID REFERENCES course(course_id),
@@ -149,7 +161,7 @@ CREATE TABLE section_meeting (
 );
 
 -- GiST index to accelerate overlap queries for conflict detection
-CREATE INDEX section_meeting_section_id_idx ON section_meeting (section_id);
+CREATE INDEX section_meeting_section_day_idx ON section_meeting (section_id, day_of_week);
 CREATE INDEX section_meeting_tr_gist ON section_meeting USING GIST (day_of_week, time_range);
 
 -- --------------------------------------------------------------------
@@ -164,6 +176,9 @@ CREATE TABLE enrollment (
     UNIQUE (student_id, section_id)
 );
 
+CREATE INDEX enrollment_student_status_idx ON enrollment (student_id, status);
+CREATE INDEX enrollment_section_status_idx ON enrollment (section_id, status);
+
 -- --------------------------------------------------------------------
 -- Registration request workflow
 -- Requests model ADD/DROP/CHANGE_SECTION changes.  Decision
@@ -180,6 +195,12 @@ CREATE TABLE registration_request (
     created_at        TIMESTAMPTZ DEFAULT now()
 );
 
+CREATE INDEX registration_request_student_type_state_idx
+    ON registration_request (student_id, type, state);
+CREATE INDEX registration_request_student_created_idx
+    ON registration_request (student_id, created_at DESC);
+CREATE INDEX registration_request_state_idx ON registration_request (state);
+
 CREATE TABLE request_decision (
     decision_id UUID PRIMARY KEY,
     request_id  UUID REFERENCES registration_request(request_id) ON DELETE CASCADE,
@@ -196,6 +217,18 @@ CREATE TABLE request_conflict (
     details    JSONB
 );
 
+-- Enrollment problems reported to department heads.  Rows are written
+-- in batches by the backend, so there are no foreign keys that could
+-- reject a whole batch.
+CREATE TABLE department_notification (
+    id              BIGSERIAL PRIMARY KEY,
+    student_id      UUID NOT NULL,
+    course_code     TEXT NOT NULL,
+    department_id   UUID,
+    reason          TEXT NOT NULL,
+    created_at      TIMESTAMPTZ DEFAULT now()
+);
+
 -- --------------------------------------------------------------------
 -- Calendar events and bindings
 -- --------------------------------------------------------------------